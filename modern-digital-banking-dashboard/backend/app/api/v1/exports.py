@@ -2,14 +2,14 @@
 Export APIs for CSV, PDF, and other formats
 """
 import io
-import csv
 import json
 from datetime import datetime, timedelta
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse, JSONResponse, FileResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
+from starlette.background import BackgroundTask
 
 from app.core.database import get_db
 from app.models.user import User
@@ -21,7 +21,7 @@ from app.schemas.export import (
     ExportType,
     ExportStatusResponse
 )
-from app.services.export_service import ExportService
+from app.services.export_service import ExportService, iter_csv
 from app.api.deps import get_current_active_user
 from app.core.config import settings
 
@@ -91,10 +91,20 @@ async def download_export(
             detail="Not authorized to access this export"
         )
     
+    # Expiry can remove the file after the lookup above
+    try:
+        with open(export_data["path"], "rb") as export_file:
+            content = export_file.read()
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail="Export not found or expired"
+        )
+    
     # Return file
     if export_data["format"] == ExportFormat.CSV:
         return StreamingResponse(
-            io.StringIO(export_data["content"]),
+            io.BytesIO(content),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename={export_data['filename']}"
@@ -102,7 +112,7 @@ async def download_export(
         )
     elif export_data["format"] == ExportFormat.JSON:
         return JSONResponse(
-            content=json.loads(export_data["content"]),
+            content=json.loads(content),
             headers={
                 "Content-Disposition": f"attachment; filename={export_data['filename']}"
             }
@@ -111,7 +121,7 @@ async def download_export(
         # For PDF, we'd typically save to a file and serve it
         # This is a simplified version
         return StreamingResponse(
-            io.BytesIO(export_data["content"].encode() if isinstance(export_data["content"], str) else export_data["content"]),
+            io.BytesIO(content),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={export_data['filename']}"
@@ -130,57 +140,78 @@ async def export_transactions_csv(
     """
     Direct CSV export of transactions (streaming response)
     """
-    # Build query
-    query = db.query(Transaction).filter(Transaction.user_id == current_user.id)
+    # Select only the CSV columns; the account comes from the join rather
+    # than a lazy load per row
+    stmt = (
+        select(
+            Transaction.date,
+            Transaction.description,
+            Transaction.category,
+            Transaction.amount,
+            Transaction.transaction_type,
+            Account.account_number,
+            Transaction.status
+        )
+        .outerjoin(Transaction.account)
+        .where(Transaction.user_id == current_user.id)
+    )
     
     if start_date:
-        query = query.filter(Transaction.date >= start_date)
+        stmt = stmt.where(Transaction.date >= start_date)
     
     if end_date:
-        query = query.filter(Transaction.date <= end_date)
+        stmt = stmt.where(Transaction.date <= end_date)
     
     if account_id:
-        query = query.filter(Transaction.account_id == account_id)
+        stmt = stmt.where(Transaction.account_id == account_id)
     
     if category:
-        query = query.filter(Transaction.category == category)
+        stmt = stmt.where(Transaction.category == category)
+    
+    stmt = stmt.order_by(Transaction.date.desc()).execution_options(yield_per=1000)
     
-    # Get transactions
-    transactions = query.order_by(Transaction.date.desc()).all()
+    # The stream owns its session: the request's session is a yield
+    # dependency, which newer FastAPI closes before the body is sent.
+    # Running the query here means a failing query is still an error
+    # response rather than a truncated 200.
+    session = Session(bind=db.get_bind())
+    try:
+        result = session.execute(stmt)
+    except Exception:
+        session.close()
+        raise
     
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
+    def rows():
+        try:
+            for date, description, category, amount, transaction_type, account, status in result:
+                yield [
+                    date.isoformat() if date else "",
+                    description,
+                    category,
+                    f"{amount:.2f}",
+                    transaction_type.value,
+                    account or "",
+                    status.value,
+                    ""  # Transactions have no notes column yet
+                ]
+        finally:
+            session.close()
     
-    # Write header
-    writer.writerow([
+    header = [
         "Date", "Description", "Category", "Amount", 
         "Type", "Account", "Status", "Notes"
-    ])
-    
-    # Write data
-    for transaction in transactions:
-        writer.writerow([
-            transaction.date.strftime("%Y-%m-%d"),
-            transaction.description,
-            transaction.category,
-            f"{transaction.amount:.2f}",
-            transaction.transaction_type.value,
-            transaction.account.name if transaction.account else "",
-            transaction.status.value,
-            transaction.notes or ""
-        ])
-    
-    # Return streaming response
-    output.seek(0)
+    ]
     filename = f"transactions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
     
+    # Return streaming response; rows are written as the client reads them.
+    # The background task closes the session if the stream never starts.
     return StreamingResponse(
-        output,
+        iter_csv(header, rows()),
         media_type="text/csv",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
-        }
+        },
+        background=BackgroundTask(session.close)
     )
 
 @router.get("/summary/pdf")
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import List, Optional
 
 from pydantic_settings import BaseSettings
@@ -83,6 +84,11 @@ class Settings(BaseSettings):
     REWARD_BASE_POINTS_PER_DOLLAR: int = 10
     REWARD_ON_TIME_MULTIPLIER: float = 1.5
 
+    # Exports (each process writes to its own subdirectory)
+    EXPORT_DIR: str = os.getenv(
+        "EXPORT_DIR", os.path.join(tempfile.gettempdir(), "banking_dashboard_exports")
+    )
+
     # Environment
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     DEBUG: bool = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
@@ -177,8 +177,8 @@ class CRUDBill:
             extract('year', self.model.due_date) == year
         ).all()
         
-        # Calculate totals
-        total_amount = sum(float(bill.amount_usd) for bill in bills)
+        # Calculate totals in Decimal so the cents survive ("300.00", not 300.0)
+        total_amount = sum((bill.amount_usd for bill in bills), Decimal("0"))
         paid_bills = [b for b in bills if b.is_paid]
         unpaid_bills = [b for b in bills if not b.is_paid]
         
@@ -187,14 +187,14 @@ class CRUDBill:
         for bill in bills:
             if bill.category not in category_breakdown:
                 category_breakdown[bill.category] = {
-                    'total_amount': 0,
+                    'total_amount': Decimal("0"),
                     'bill_count': 0,
                     'paid_count': 0,
                     'unpaid_count': 0
                 }
             
             breakdown = category_breakdown[bill.category]
-            breakdown['total_amount'] += float(bill.amount_usd)
+            breakdown['total_amount'] += bill.amount_usd
             breakdown['bill_count'] += 1
             
             if bill.is_paid:
@@ -206,7 +206,7 @@ class CRUDBill:
         category_list = [
             {
                 'category': category,
-                'total_amount': Decimal(str(data['total_amount'])),
+                'total_amount': data['total_amount'],
                 'bill_count': data['bill_count'],
                 'paid_count': data['paid_count'],
                 'unpaid_count': data['unpaid_count']
@@ -216,7 +216,7 @@ class CRUDBill:
         
         return {
             'total_bills': len(bills),
-            'total_amount': Decimal(str(total_amount)),
+            'total_amount': total_amount,
             'paid_bills': len(paid_bills),
             'unpaid_bills': len(unpaid_bills),
             'category_breakdown': category_list
@@ -101,44 +101,41 @@ class CRUDReward:
         # Get last 6 months
         six_months_ago = datetime.now() - timedelta(days=180)
         
-        # Query monthly data
-        monthly_data = db.query(
-            func.date_trunc('month', self.model.earned_at).label('month'),
-            func.sum(self.model.points).label('total_points'),
+        # One query grouped by month and category; months are folded
+        # together below instead of querying categories once per month
+        month = func.date_trunc('month', self.model.earned_at)
+        rows = db.query(
+            month.label('month'),
+            self.model.category,
+            func.sum(self.model.points).label('category_points'),
             func.count(self.model.id).label('reward_count')
         ).filter(
             self.model.user_id == user_id,
             self.model.earned_at >= six_months_ago
         ).group_by(
-            func.date_trunc('month', self.model.earned_at)
+            month,
+            self.model.category
         ).order_by(
-            desc(func.date_trunc('month', self.model.earned_at))
+            desc(month)
         ).all()
         
-        # Get category breakdown for each month
-        result = []
-        for row in monthly_data:
-            month_str = row.month.strftime('%Y-%m')
-            
-            # Get categories for this month
-            categories_data = db.query(
-                self.model.category,
-                func.sum(self.model.points).label('category_points')
-            ).filter(
-                self.model.user_id == user_id,
-                func.date_trunc('month', self.model.earned_at) == row.month
-            ).group_by(self.model.category).all()
-            
-            categories = {row.category: row.category_points for row in categories_data}
+        # Rows arrive newest month first, so insertion order is the result order
+        months: Dict[Any, Dict[str, Any]] = {}
+        for row in rows:
+            entry = months.get(row.month)
+            if entry is None:
+                entry = months[row.month] = {
+                    'month': row.month.strftime('%Y-%m'),
+                    'total_points': 0,
+                    'reward_count': 0,
+                    'categories': {}
+                }
             
-            result.append({
-                'month': month_str,
-                'total_points': row.total_points or 0,
-                'reward_count': row.reward_count or 0,
-                'categories': categories
-            })
+            entry['total_points'] += row.category_points or 0
+            entry['reward_count'] += row.reward_count or 0
+            entry['categories'][row.category] = row.category_points
         
-        return result
+        return list(months.values())
     
     def get_leaderboard(self, db: Session, period: str = "monthly", limit: int = 10) -> List[Dict[str, Any]]:
         """Get reward points leaderboard"""
@@ -7,6 +7,7 @@ from apscheduler.triggers.cron import CronTrigger
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.core.database import engine, Base
+from app.services.export_service import remove_export_files
 
 # Ensure models are imported so metadata is registered
 from app.models import (
@@ -72,6 +73,9 @@ async def lifespan(app: FastAPI):
     # -----------------------
     scheduler.shutdown()
 
+    # The export cache dies with this process; delete the files it created
+    remove_export_files()
+
 
 # app = FastAPI(
 #     title=settings.PROJECT_NAME,
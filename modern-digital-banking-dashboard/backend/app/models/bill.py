@@ -100,6 +100,7 @@ class Bill(Base):
             "reminder_days": self.reminder_days,
             "days_until_due": self.days_until_due,
             "is_overdue": self.is_overdue,
+            "should_remind": self.should_remind,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
\ No newline at end of file
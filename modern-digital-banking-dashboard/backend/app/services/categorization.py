@@ -1,15 +1,68 @@
+import re
+from functools import lru_cache
 from sqlalchemy.orm import Session
 from sqlalchemy import extract, func
-from typing import Optional, Dict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 from datetime import date
 
 from ..models.transaction import Transaction
+from ..schemas.categorization import PatternType
+
+
+# Only the tests call match_rule/match_rules so far. The categories
+# router's rule endpoints need create_rule, get_user_rules and a
+# CategoryRule model, which this tree does not have yet.
+@lru_cache(maxsize=1024)
+def _compile_rule(pattern_type: PatternType, pattern: str) -> Callable[[str], bool]:
+    """Build the matcher for a rule pattern, normalizing the pattern once.
+
+    Matchers take an already lowercased description. Plain-text patterns
+    are lowercased here, whatever case the rule was stored in; regexes
+    compile with IGNORECASE instead, since lowercasing one could change
+    its meaning (\\S -> \\s).
+    """
+    if pattern_type == PatternType.REGEX:
+        search = re.compile(pattern, re.IGNORECASE).search
+        return lambda description: search(description) is not None
+
+    pattern = pattern.lower()
+    if pattern_type == PatternType.EXACT:
+        return lambda description: description == pattern
+    if pattern_type == PatternType.STARTS_WITH:
+        return lambda description: description.startswith(pattern)
+    if pattern_type == PatternType.ENDS_WITH:
+        return lambda description: description.endswith(pattern)
+    return lambda description: pattern in description
 
 
 class CategorizationService:
     def __init__(self, db: Session):
         self.db = db
 
+    def match_rule(self, description: str, rule) -> bool:
+        """Check whether a transaction description matches a rule (case-insensitive)"""
+        if not description:
+            return False
+
+        return _compile_rule(rule.pattern_type, rule.pattern)(description.lower())
+
+    def match_rules(self, descriptions: Iterable[str], rules: Sequence) -> List[Optional[object]]:
+        """Return the first matching rule (in the given order) for each description.
+
+        Each rule's matcher is looked up once for the whole batch, and each
+        description is lowercased once rather than once per rule.
+        """
+        matchers = [(rule, _compile_rule(rule.pattern_type, rule.pattern)) for rule in rules]
+
+        matches = []
+        for description in descriptions:
+            match = None
+            if description:
+                lowered = description.lower()
+                match = next((rule for rule, matcher in matchers if matcher(lowered)), None)
+            matches.append(match)
+        return matches
+
     def get_category_statistics(
         self,
         user_id: int,
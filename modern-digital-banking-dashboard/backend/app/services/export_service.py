@@ -2,13 +2,19 @@
 Service for generating export files (CSV, PDF, Excel)
 """
 import io
+import os
 import csv
-import json
+import itertools
 import uuid
+import tempfile
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from decimal import Decimal
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator, Sequence
+import orjson
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_, func, select, case
 import pandas as pd
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
@@ -22,7 +28,118 @@ from app.models.budget import Budget
 from app.schemas.export import ExportRequest, ExportFormat, ExportType
 from app.core.config import settings
 
-EXPORT_CACHE: Dict[str, Dict[str, Any]] = {}
+EXPORT_TTL = timedelta(days=7)
+
+# How the summaries classify transaction types; transfers move money
+# between the user's own accounts and count as neither
+INCOME_TYPES = (TransactionType.CREDIT, TransactionType.DEPOSIT)
+EXPENSE_TYPES = (TransactionType.DEBIT, TransactionType.WITHDRAWAL, TransactionType.PAYMENT)
+
+def _remove_export_file(export_data: Dict[str, Any]) -> None:
+    """Delete the temp file backing an export, if it is still there"""
+    try:
+        os.unlink(export_data["path"])
+    except FileNotFoundError:
+        pass
+
+class _ExportCache(TTLCache):
+    """TTLCache that removes an export's file when the entry expires or is evicted"""
+    
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for _, export_data in expired:
+            _remove_export_file(export_data)
+        return expired
+    
+    def popitem(self):
+        export_id, export_data = super().popitem()
+        _remove_export_file(export_data)
+        return export_id, export_data
+
+# Export metadata only; the generated content lives in a file under
+# this process's export directory at "path"
+EXPORT_CACHE: Dict[str, Dict[str, Any]] = _ExportCache(
+    maxsize=1024, ttl=EXPORT_TTL.total_seconds()
+)
+EXPORT_CACHE_LOCK = threading.Lock()
+
+# Directory holding this process's export files; created on first use
+# under settings.EXPORT_DIR so workers sharing that path never touch
+# each other's files
+_export_dir: Optional[str] = None
+_export_dir_pid: Optional[int] = None
+_export_dir_lock = threading.Lock()
+
+def _get_export_dir() -> str:
+    """Return this process's export directory, creating it if needed"""
+    global _export_dir, _export_dir_pid
+    with _export_dir_lock:
+        # A forked worker must not share its parent's directory
+        if _export_dir is None or _export_dir_pid != os.getpid():
+            os.makedirs(settings.EXPORT_DIR, exist_ok=True)
+            _export_dir = tempfile.mkdtemp(prefix="exports_", dir=settings.EXPORT_DIR)
+            _export_dir_pid = os.getpid()
+        return _export_dir
+
+def remove_export_files() -> None:
+    """Drop every cached export and delete the files this process created.
+    
+    Call on shutdown; nothing outside this process's own directory is removed.
+    """
+    global _export_dir
+    with EXPORT_CACHE_LOCK:
+        exports = list(EXPORT_CACHE.values())
+        EXPORT_CACHE.clear()
+    for export_data in exports:
+        _remove_export_file(export_data)
+    
+    with _export_dir_lock:
+        if _export_dir is not None and _export_dir_pid == os.getpid():
+            try:
+                os.rmdir(_export_dir)
+            except OSError:
+                pass
+            _export_dir = None
+
+TRANSACTION_CSV_HEADER = (
+    "ID", "Date", "Description", "Category", "Amount",
+    "Type", "Account", "Status", "Notes", "Tags"
+)
+
+ACCOUNT_CSV_HEADER = (
+    "ID", "Name", "Type", "Balance", "Currency",
+    "Limit", "Interest Rate", "Last Updated", "Status"
+)
+
+def dumps_json(data: Any) -> str:
+    """Serialize export data as indented JSON; unknown types such as Decimal fall back to str"""
+    return orjson.dumps(
+        data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    ).decode("utf-8")
+
+def encode_csv(rows: Iterable[Sequence[Any]]) -> bytes:
+    """Write rows as CSV straight into a UTF-8 byte buffer"""
+    output = io.BytesIO()
+    text = io.TextIOWrapper(output, encoding="utf-8", newline="", write_through=True)
+    csv.writer(text).writerows(rows)
+    
+    # Detach so the wrapper doesn't close the buffer when collected
+    text.detach()
+    return output.getvalue()
+
+def iter_csv(header: Sequence[Any], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """Yield CSV text one line at a time so large exports can be streamed"""
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    
+    writer.writerow(header)
+    yield buffer.getvalue()
+    
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerow(row)
+        yield buffer.getvalue()
 
 class ExportService:
     """Service for generating export files"""
@@ -73,6 +190,17 @@ class ExportService:
         elif export_request.format == ExportFormat.JSON:
             filename += ".json"
         
+        # CSV and PDF writers return bytes; JSON text is stored UTF-8 encoded
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        
+        # Write content to disk so the cache only holds metadata
+        with tempfile.NamedTemporaryFile(
+            prefix="export_", suffix=os.path.splitext(filename)[1],
+            dir=_get_export_dir(), delete=False
+        ) as export_file:
+            export_file.write(content)
+        
         # Store export metadata
         export_data = {
             "export_id": export_id,
@@ -80,7 +208,8 @@ class ExportService:
             "filename": filename,
             "format": export_request.format,
             "export_type": export_request.export_type,
-            "content": content,
+            "path": export_file.name,
+            "file_size": len(content),
 
             # ✅ ADD THESE
             "status": "completed",        # since generation is synchronous
@@ -88,46 +217,48 @@ class ExportService:
             "estimated_completion": None,
 
             "created_at": datetime.now(),
-            "expires_at": datetime.now() + timedelta(days=7),
+            "expires_at": datetime.now() + EXPORT_TTL,
             "download_count": 0
         }
 
         
         # Cache the export (in production, save to database or storage)
-        EXPORT_CACHE[export_id] = export_data
+        with EXPORT_CACHE_LOCK:
+            EXPORT_CACHE[export_id] = export_data
         
-        return export_data
+        return {**export_data, "content": content}
     
     def get_export(self, export_id: str, increment_download: bool = False):
-        export_data = EXPORT_CACHE.get(export_id)
-
-        if not export_data:
-            return None
+        """Return a copy of an export's metadata; its content stays on disk at "path" """
+        with EXPORT_CACHE_LOCK:
+            export_data = EXPORT_CACHE.get(export_id)
 
-        if export_data["expires_at"] < datetime.now():
-            del EXPORT_CACHE[export_id]
-            return None
+            if not export_data:
+                return None
 
-        if increment_download:
-            export_data["download_count"] += 1
+            if increment_download:
+                export_data["download_count"] += 1
 
-        return export_data
+            return dict(export_data)
     
     def delete_export(self, export_id: str, user_id: int) -> bool:
         """Delete an export file"""
-        if export_id in EXPORT_CACHE:
-            export_data = EXPORT_CACHE[export_id]
-            if export_data["user_id"] == user_id:
-                del EXPORT_CACHE[export_id]
-                return True
-        return False
+        with EXPORT_CACHE_LOCK:
+            export_data = EXPORT_CACHE.get(export_id)
+            if not export_data or export_data["user_id"] != user_id:
+                return False
+            EXPORT_CACHE.pop(export_id, None)
+        _remove_export_file(export_data)
+        return True
     
     def get_export_history(self, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
         """Get user's export history"""
-        user_exports = [
-            export for export in EXPORT_CACHE.values()
-            if export["user_id"] == self.user_id
-        ]
+        with EXPORT_CACHE_LOCK:
+            user_exports = [
+                {key: value for key, value in export.items() if key != "path"}
+                for export in EXPORT_CACHE.values()
+                if export["user_id"] == self.user_id
+            ]
         
         # Sort by creation date (newest first)
         user_exports.sort(key=lambda x: x["created_at"], reverse=True)
@@ -238,68 +369,43 @@ class ExportService:
             end_date = datetime.now()
             start_date = datetime(end_date.year, end_date.month, 1)
         
-        # Get transactions
-        transactions = self.db.query(Transaction).filter(
-            Transaction.user_id == self.user_id,
-            Transaction.date >= start_date,
-            Transaction.date <= end_date,
-            Transaction.status == "completed"
-        ).all()
-        
-        # Calculate summary data
-        summary_data = self._calculate_financial_summary(transactions, start_date, end_date)
+        # Calculate summary data from SQL aggregates
+        summary_data = self._calculate_financial_summary(None, start_date, end_date)
         
         if format == ExportFormat.PDF:
             return self._financial_summary_to_pdf(summary_data, start_date, end_date)
         elif format == ExportFormat.JSON:
-            return json.dumps(summary_data, indent=2, default=str)
+            return dumps_json(summary_data)
         else:
             # For other formats, return JSON
-            return json.dumps(summary_data, indent=2, default=str)
+            return dumps_json(summary_data)
     
     # CSV Generation Methods
-    def _transactions_to_csv(self, transactions: List[Transaction]) -> str:
-        """Convert transactions to CSV format"""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            "ID", "Date", "Description", "Category", "Amount",
-            "Type", "Account", "Status", "Notes", "Tags"
-        ])
-        
-        # Write data
-        for transaction in transactions:
-            writer.writerow([
-                transaction.id,
-                transaction.date.strftime("%Y-%m-%d"),
-                transaction.description,
-                transaction.category or "",
-                f"{transaction.amount:.2f}",
-                transaction.transaction_type.value,
-                transaction.account.name if transaction.account else "",
-                transaction.status.value,
-                transaction.notes or "",
-                ", ".join([tag.name for tag in transaction.tags]) if transaction.tags else ""
-            ])
-        
-        return output.getvalue()
+    def _transactions_to_csv(self, transactions: List[Transaction]) -> bytes:
+        """Convert transactions to UTF-8 encoded CSV"""
+        return encode_csv(
+            itertools.chain((TRANSACTION_CSV_HEADER,), map(self._transaction_csv_row, transactions))
+        )
     
-    def _accounts_to_csv(self, accounts: List[Account]) -> str:
-        """Convert accounts to CSV format"""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            "ID", "Name", "Type", "Balance", "Currency",
-            "Limit", "Interest Rate", "Last Updated", "Status"
-        ])
-        
-        # Write data
-        for account in accounts:
-            writer.writerow([
+    def _transaction_csv_row(self, transaction: Transaction) -> Tuple[Any, ...]:
+        """Format one transaction in TRANSACTION_CSV_HEADER order"""
+        return (
+            transaction.id,
+            transaction.date.isoformat(),
+            transaction.description,
+            transaction.category or "",
+            f"{transaction.amount:.2f}",
+            transaction.transaction_type.value,
+            transaction.account.name if transaction.account else "",
+            transaction.status.value,
+            transaction.notes or "",
+            ", ".join([tag.name for tag in transaction.tags]) if transaction.tags else ""
+        )
+    
+    def _accounts_to_csv(self, accounts: List[Account]) -> bytes:
+        """Convert accounts to UTF-8 encoded CSV"""
+        rows = (
+            (
                 account.id,
                 account.name,
                 account.account_type.value,
@@ -309,53 +415,54 @@ class ExportService:
                 f"{account.interest_rate:.2f}%" if account.interest_rate else "",
                 account.updated_at.strftime("%Y-%m-%d %H:%M:%S") if account.updated_at else "",
                 "Active" if account.is_active else "Inactive"
-            ])
+            )
+            for account in accounts
+        )
         
-        return output.getvalue()
+        return encode_csv(itertools.chain((ACCOUNT_CSV_HEADER,), rows))
     
-    def _cash_flow_to_csv(self, cash_flow_data: Dict[str, Any]) -> str:
-        """Convert cash flow data to CSV format"""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write summary section
-        writer.writerow(["CASH FLOW SUMMARY"])
-        writer.writerow(["Period", cash_flow_data["period"]])
-        writer.writerow(["Total Income", f"${cash_flow_data['total_income']:.2f}"])
-        writer.writerow(["Total Expenses", f"${cash_flow_data['total_expenses']:.2f}"])
-        writer.writerow(["Net Cash Flow", f"${cash_flow_data['net_cash_flow']:.2f}"])
-        writer.writerow(["Savings Rate", f"{cash_flow_data['savings_rate']:.1f}%"])
-        writer.writerow([])
-        
-        # Write category breakdown
-        writer.writerow(["CATEGORY BREAKDOWN (Expenses)"])
-        writer.writerow(["Category", "Amount", "Percentage", "Transaction Count"])
+    def _cash_flow_to_csv(self, cash_flow_data: Dict[str, Any]) -> bytes:
+        """Convert cash flow data to UTF-8 encoded CSV"""
+        return encode_csv(self._cash_flow_csv_rows(cash_flow_data))
+    
+    def _cash_flow_csv_rows(self, cash_flow_data: Dict[str, Any]) -> Iterator[List[Any]]:
+        """Yield the cash flow report's CSV rows, section by section"""
+        # Summary section
+        yield ["CASH FLOW SUMMARY"]
+        yield ["Period", cash_flow_data["period"]]
+        yield ["Total Income", f"${cash_flow_data['total_income']:.2f}"]
+        yield ["Total Expenses", f"${cash_flow_data['total_expenses']:.2f}"]
+        yield ["Net Cash Flow", f"${cash_flow_data['net_cash_flow']:.2f}"]
+        yield ["Savings Rate", f"{cash_flow_data['savings_rate']:.1f}%"]
+        yield []
+        
+        # Category breakdown
+        yield ["CATEGORY BREAKDOWN (Expenses)"]
+        yield ["Category", "Amount", "Percentage", "Transaction Count"]
         
         for category in cash_flow_data.get("category_breakdown", []):
-            writer.writerow([
+            yield [
                 category["category"],
                 f"${category['amount']:.2f}",
                 f"{category['percentage']:.1f}%",
                 category["transaction_count"]
-            ])
+            ]
         
-        writer.writerow([])
+        yield []
         
-        # Write transactions
-        writer.writerow(["TRANSACTIONS"])
-        writer.writerow(["Date", "Description", "Category", "Amount", "Type", "Account"])
+        # Transactions
+        yield ["TRANSACTIONS"]
+        yield ["Date", "Description", "Category", "Amount", "Type", "Account"]
         
         for transaction in cash_flow_data.get("transactions", []):
-            writer.writerow([
+            yield [
                 transaction["date"],
                 transaction["description"],
                 transaction["category"],
                 f"${transaction['amount']:.2f}",
                 transaction["type"],
                 transaction["account"]
-            ])
-        
-        return output.getvalue()
+            ]
     
     # JSON Generation Methods
     def _transactions_to_json(self, transactions: List[Transaction]) -> str:
@@ -380,11 +487,11 @@ class ExportService:
             }
             transactions_data.append(transaction_data)
         
-        return json.dumps({
+        return dumps_json({
             "transactions": transactions_data,
             "count": len(transactions_data),
             "generated_at": datetime.now().isoformat()
-        }, indent=2)
+        })
     
     def _accounts_to_json(self, accounts: List[Account]) -> str:
         """Convert accounts to JSON format"""
@@ -405,16 +512,16 @@ class ExportService:
             }
             accounts_data.append(account_data)
         
-        return json.dumps({
+        return dumps_json({
             "accounts": accounts_data,
             "count": len(accounts_data),
             "total_balance": sum(account.balance for account in accounts),
             "generated_at": datetime.now().isoformat()
-        }, indent=2)
+        })
     
     def _cash_flow_to_json(self, cash_flow_data: Dict[str, Any]) -> str:
         """Convert cash flow data to JSON format"""
-        return json.dumps(cash_flow_data, indent=2, default=str)
+        return dumps_json(cash_flow_data)
     
     # PDF Generation Methods
     def _transactions_to_pdf(
@@ -772,11 +879,11 @@ class ExportService:
         """Calculate summary statistics for transactions"""
         total_income = sum(
             t.amount for t in transactions 
-            if t.transaction_type == TransactionType.INCOME
+            if t.transaction_type in INCOME_TYPES
         )
         total_expenses = sum(
             abs(t.amount) for t in transactions 
-            if t.transaction_type == TransactionType.EXPENSE
+            if t.transaction_type in EXPENSE_TYPES
         )
         net_cash_flow = total_income - total_expenses
         
@@ -786,6 +893,83 @@ class ExportService:
             "net_cash_flow": net_cash_flow
         }
     
+    def _transaction_rows(self, transactions: Iterable[Transaction]) -> Iterator[Tuple[Any, ...]]:
+        """One (amount, category, type, count) row per transaction, for _cash_flow_totals"""
+        for t in transactions:
+            yield t.amount, t.category or "Uncategorized", t.transaction_type, 1
+    
+    def _sql_cash_flow(self, start_date: datetime, end_date: datetime) -> List[Tuple[Any, ...]]:
+        """Aggregate completed transactions per type and category in the database.
+        
+        Returns the same (amount, category, type, count) rows as
+        _transaction_rows with one row per group, so the summaries never
+        hydrate ORM objects. Expense totals are summed as absolute amounts,
+        matching the per-row calculation.
+        """
+        amount = case(
+            (Transaction.transaction_type.in_(EXPENSE_TYPES), func.abs(Transaction.amount)),
+            else_=Transaction.amount
+        )
+        category = func.coalesce(Transaction.category, "Uncategorized")
+        stmt = (
+            select(
+                func.sum(amount, type_=Transaction.amount.type).label("total"),
+                category.label("category"),
+                Transaction.transaction_type,
+                func.count().label("n")
+            )
+            .where(
+                Transaction.user_id == self.user_id,
+                Transaction.date >= start_date,
+                Transaction.date <= end_date,
+                Transaction.status == "completed"
+            )
+            .group_by(Transaction.transaction_type, category)
+        )
+        
+        return [tuple(row) for row in self.db.execute(stmt)]
+    
+    def _cash_flow_totals(self, rows: Iterable[Tuple[Any, ...]]) -> Dict[str, Any]:
+        """Total income and expenses and group expenses by category in one pass.
+        
+        Amounts stay Decimal. Categories come back largest first as
+        (category, amount, transaction_count) tuples.
+        """
+        total_income = Decimal("0")
+        total_expenses = Decimal("0")
+        income_count = 0
+        expense_count = 0
+        category_totals: Dict[str, Decimal] = {}
+        category_counts: Dict[str, int] = {}
+        
+        for amount, category, transaction_type, count in rows:
+            if transaction_type in INCOME_TYPES:
+                total_income += amount
+                income_count += count
+            elif transaction_type in EXPENSE_TYPES:
+                amount = abs(amount)
+                total_expenses += amount
+                expense_count += count
+                category_totals[category] = category_totals.get(category, Decimal("0")) + amount
+                category_counts[category] = category_counts.get(category, 0) + count
+        
+        categories = sorted(
+            (
+                (category, amount, category_counts[category])
+                for category, amount in category_totals.items()
+            ),
+            key=lambda x: x[1],
+            reverse=True
+        )
+        
+        return {
+            "total_income": total_income,
+            "total_expenses": total_expenses,
+            "income_count": income_count,
+            "expense_count": expense_count,
+            "categories": categories
+        }
+    
     def _calculate_cash_flow_data(
         self, 
         transactions: List[Transaction],
@@ -793,14 +977,10 @@ class ExportService:
         end_date: datetime
     ) -> Dict[str, Any]:
         """Calculate cash flow data for export"""
-        total_income = sum(
-            t.amount for t in transactions 
-            if t.transaction_type == TransactionType.INCOME
-        )
-        total_expenses = sum(
-            abs(t.amount) for t in transactions 
-            if t.transaction_type == TransactionType.EXPENSE
-        )
+        totals = self._cash_flow_totals(self._transaction_rows(transactions))
+        
+        total_income = totals["total_income"]
+        total_expenses = totals["total_expenses"]
         net_cash_flow = total_income - total_expenses
         
         # Calculate savings rate
@@ -808,35 +988,17 @@ class ExportService:
         if total_income > 0:
             savings_rate = (net_cash_flow / total_income) * 100
         
-        # Calculate category breakdown
-        category_totals = {}
-        category_counts = {}
-        
-        for transaction in transactions:
-            if transaction.transaction_type == TransactionType.EXPENSE:
-                category = transaction.category or "Uncategorized"
-                amount = abs(transaction.amount)
-                
-                if category not in category_totals:
-                    category_totals[category] = 0
-                    category_counts[category] = 0
-                
-                category_totals[category] += amount
-                category_counts[category] += 1
-        
+        # Calculate category breakdown (sorted by amount, descending)
         category_breakdown = []
-        for category, amount in category_totals.items():
+        for category, amount, count in totals["categories"]:
             percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
             category_breakdown.append({
                 "category": category,
                 "amount": amount,
                 "percentage": percentage,
-                "transaction_count": category_counts[category]
+                "transaction_count": count
             })
         
-        # Sort categories by amount (descending)
-        category_breakdown.sort(key=lambda x: x["amount"], reverse=True)
-        
         # Prepare transaction data for export
         transaction_data = []
         for transaction in transactions:
@@ -863,23 +1025,24 @@ class ExportService:
     
     def _calculate_financial_summary(
         self,
-        transactions: List[Transaction],
+        transactions: Optional[List[Transaction]],
         start_date: datetime,
         end_date: datetime
     ) -> Dict[str, Any]:
-        """Calculate comprehensive financial summary"""
+        """Calculate comprehensive financial summary
+        
+        Pass None for transactions to aggregate the period in SQL instead
+        of over an already-fetched list.
+        """
         # Calculate basic metrics
-        income_transactions = [
-            t for t in transactions 
-            if t.transaction_type == TransactionType.INCOME
-        ]
-        expense_transactions = [
-            t for t in transactions 
-            if t.transaction_type == TransactionType.EXPENSE
-        ]
+        if transactions is None:
+            rows = self._sql_cash_flow(start_date, end_date)
+        else:
+            rows = self._transaction_rows(transactions)
+        totals = self._cash_flow_totals(rows)
         
-        total_income = sum(t.amount for t in income_transactions)
-        total_expenses = sum(abs(t.amount) for t in expense_transactions)
+        total_income = totals["total_income"]
+        total_expenses = totals["total_expenses"]
         net_cash_flow = total_income - total_expenses
         
         # Calculate savings rate
@@ -888,18 +1051,9 @@ class ExportService:
             savings_rate = (net_cash_flow / total_income) * 100
         
         # Calculate category breakdown
-        category_expenses = {}
-        for transaction in expense_transactions:
-            category = transaction.category or "Uncategorized"
-            if category not in category_expenses:
-                category_expenses[category] = 0
-            category_expenses[category] += abs(transaction.amount)
-        
-        top_categories = sorted(
-            category_expenses.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        top_categories = [
+            (category, amount) for category, amount, _ in totals["categories"][:5]
+        ]
         
         # Calculate trends (simplified)
         # In a real implementation, you would compare with previous periods
@@ -912,12 +1066,12 @@ class ExportService:
                 "Consider increasing your savings rate to at least 10% for better financial security."
             )
         
-        if total_expenses > total_income * 0.8:
+        if total_expenses > total_income * Decimal("0.8"):
             recommendations.append(
                 "Your expenses are high relative to your income. Consider reviewing your spending habits."
             )
         
-        if len(top_categories) > 0 and top_categories[0][1] > total_expenses * 0.3:
+        if len(top_categories) > 0 and top_categories[0][1] > total_expenses * Decimal("0.3"):
             recommendations.append(
                 f"Your spending on '{top_categories[0][0]}' is quite high. "
                 f"Consider setting a budget for this category."
@@ -933,8 +1087,8 @@ class ExportService:
                 "total_expenses": total_expenses,
                 "net_cash_flow": net_cash_flow,
                 "savings_rate": savings_rate,
-                "income_transactions": len(income_transactions),
-                "expense_transactions": len(expense_transactions)
+                "income_transactions": totals["income_count"],
+                "expense_transactions": totals["expense_count"]
             },
             "top_categories": [
                 {"category": cat, "amount": amt} for cat, amt in top_categories
@@ -947,7 +1101,7 @@ class ExportService:
         """Convert transactions to Excel format"""
         # This would use pandas to create an Excel file
         # For now, returning CSV as placeholder
-        return self._transactions_to_csv(transactions).encode('utf-8')
+        return self._transactions_to_csv(transactions)
     
     def generate_pdf_summary(self, month: int, year: int) -> Optional[bytes]:
         """Generate PDF summary for a specific month"""
@@ -958,17 +1112,9 @@ class ExportService:
             else:
                 month_end = datetime(year, month + 1, 1) - timedelta(days=1)
             
-            # Get transactions for the month
-            transactions = self.db.query(Transaction).filter(
-                Transaction.user_id == self.user_id,
-                Transaction.date >= month_start,
-                Transaction.date <= month_end,
-                Transaction.status == "completed"
-            ).all()
-            
-            # Generate PDF
+            # Generate PDF from the month's SQL aggregates
             return self._financial_summary_to_pdf(
-                self._calculate_financial_summary(transactions, month_start, month_end),
+                self._calculate_financial_summary(None, month_start, month_end),
                 month_start,
                 month_end
             )
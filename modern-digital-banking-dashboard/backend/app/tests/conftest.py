@@ -0,0 +1,330 @@
+"""
+Shared fixtures for the backend test suite
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, sessionmaker, raiseload
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.api import deps
+from app.core.database import Base, get_db
+from app.core.security import create_access_token, get_password_hash
+from app.models.bill import Bill, CurrencyCode
+from app.models.reward import Reward
+from app.models.user import User
+from app.tests.utils import D100, D150
+
+# In-memory test database: no disk I/O, and each pytest-xdist worker is
+# its own process, so workers never share it. StaticPool hands the one
+# connection to every checkout, which keeps the in-memory schema alive
+# and visible to the TestClient thread.
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+# pysqlite emits its own BEGIN/COMMIT which breaks SAVEPOINT handling;
+# let SQLAlchemy manage the transaction boundaries instead.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+# Sessions join the connection's open transaction through a SAVEPOINT,
+# so commit() inside tests and endpoints never ends the outer transaction.
+# Attributes are kept after commit to avoid a reload SELECT on next access.
+TestingSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+    join_transaction_mode="create_savepoint",
+)
+
+# Override get_db dependency
+def override_get_db():
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+# Auth resolves deps.get_db while most routers use core get_db. Both
+# sessions would each open a SAVEPOINT on the shared connection and close
+# out of order, so route deps.get_db to the request's core session.
+def override_deps_get_db(db: Session = Depends(get_db)):
+    return db
+
+@pytest.fixture(scope="session", autouse=True)
+def _override_db():
+    """Route every endpoint's database dependency to the test sessions"""
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[deps.get_db] = override_deps_get_db
+    yield
+    # Remove only what this fixture installed
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(deps.get_db, None)
+
+@pytest.fixture(scope="session")
+def connection():
+    """Create the schema once and hold one transaction for the whole run.
+
+    This is the only place the test schema is created or dropped; every
+    other fixture isolates itself with a SAVEPOINT on this connection.
+    """
+    Base.metadata.create_all(bind=engine)
+    conn = engine.connect()
+    transaction = conn.begin()
+    TestingSessionLocal.configure(bind=conn)
+    try:
+        yield conn
+    finally:
+        transaction.rollback()
+        conn.close()
+        TestingSessionLocal.configure(bind=engine)
+        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="session")
+def session_db(connection):
+    """Session for data shared by the whole run (seeded before any test)"""
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture(scope="module")
+def module_db(connection):
+    """Session for rows shared by one test module, rolled back when it ends"""
+    nested = connection.begin_nested()
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        if nested.is_active:
+            nested.rollback()
+
+@pytest.fixture
+def db(connection):
+    """Database session whose changes are rolled back after each test"""
+    nested = connection.begin_nested()
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        if nested.is_active:
+            nested.rollback()
+
+@pytest.fixture
+def strict_loading():
+    """Make every implicit lazy load raise, in tests and endpoints alike.
+
+    Opt in with ``@pytest.mark.usefixtures("strict_loading")``; code under
+    test must then declare its eager loads (joinedload/selectinload).
+    """
+    def _raiseload(orm_execute_state):
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                raiseload("*")
+            )
+
+    event.listen(TestingSessionLocal, "do_orm_execute", _raiseload)
+    yield
+    event.remove(TestingSessionLocal, "do_orm_execute", _raiseload)
+
+@pytest.fixture(scope="session", autouse=True)
+def _mock_currency():
+    """Patch currency conversion once for the whole run.
+
+    The bills router imports ``convert_currency`` by name, so the patch
+    targets that lookup site. Tests that assert on the mock should call
+    ``reset_mock()`` first.
+    """
+    patcher = patch(
+        "app.api.v1.bills.convert_currency",
+        return_value=Decimal("135.45")
+    )
+    mock_convert = patcher.start()
+    yield mock_convert
+    patcher.stop()
+
+@pytest.fixture
+def frozen_now():
+    """The current local time, read once so a test sees one "now" throughout.
+
+    Local rather than UTC because the reward and bill code compare against
+    ``datetime.now()``.
+    """
+    return datetime.now()
+
+@pytest.fixture
+def today(frozen_now):
+    """Today's date, taken from the same clock reading as ``frozen_now``"""
+    return frozen_now.date()
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient shared by the whole run.
+
+    Deliberately not entered as a context manager: that would run the
+    app's lifespan, which creates tables on the real database and starts
+    the scheduler.
+    """
+    return TestClient(app)
+
+@pytest.fixture(scope="session")
+def hashed_password():
+    """One bcrypt hash for every test user.
+
+    bcrypt is deliberately slow, and the tests sign tokens directly
+    rather than logging in, so no user needs a password of its own.
+    """
+    return get_password_hash("password123")
+
+# Shared reward fixtures. They are created once in session_db; tests
+# that write go through ``db``, whose SAVEPOINT is rolled back, so these
+# rows are never changed by a test. INSERT ... RETURNING loads the ids
+# and server defaults in the same statement (SQLite >= 3.35).
+@pytest.fixture(scope="session")
+def test_user(session_db, hashed_password):
+    """Create a test user for rewards"""
+    user = session_db.execute(
+        insert(User).values(
+            username="rewarduser",
+            email="reward@example.com",
+            hashed_password=hashed_password,
+            full_name="Reward Test User",
+            is_active=True,
+            points=500  # Start with some points
+        ).returning(User)
+    ).scalar_one()
+    session_db.commit()
+    return user
+
+@pytest.fixture(scope="session")
+def admin_user(session_db, hashed_password):
+    """Create an admin user"""
+    user = User(
+        username="admin",
+        email="admin@example.com",
+        hashed_password=hashed_password,
+        is_active=True,
+        is_admin=True
+    )
+    session_db.add(user)
+    session_db.commit()
+    return user
+
+def _bearer_headers(email):
+    """Sign one token that stays valid for the whole run"""
+    access_token = create_access_token(
+        data={"sub": email}, expires_delta=timedelta(hours=2)
+    )
+    return {"Authorization": f"Bearer {access_token}"}
+
+@pytest.fixture(scope="session")
+def auth_headers(test_user):
+    """Create authentication headers"""
+    return _bearer_headers(test_user.email)
+
+@pytest.fixture(scope="session")
+def admin_headers(admin_user):
+    """Create authentication headers for the admin user"""
+    return _bearer_headers(admin_user.email)
+
+@pytest.fixture(scope="session")
+def test_bill(session_db, test_user):
+    """Create a test bill for rewards"""
+    bill = session_db.execute(
+        insert(Bill).values(
+            name="Test Bill",
+            amount=D150,
+            currency=CurrencyCode.USD,
+            amount_usd=D150,
+            due_date=date.today() + timedelta(days=10),
+            category="utilities",
+            user_id=test_user.id
+        ).returning(Bill)
+    ).scalar_one()
+    session_db.commit()
+    return bill
+
+@pytest.fixture(scope="session")
+def test_reward(session_db, test_user, test_bill):
+    """Create a test reward"""
+    reward = session_db.execute(
+        insert(Reward).values(
+            user_id=test_user.id,
+            bill_id=test_bill.id,
+            points=150,
+            bill_amount=D150,
+            category="utilities",
+            on_time_payment=True,
+            description="Test reward"
+        ).returning(Reward)
+    ).scalar_one()
+    session_db.commit()
+    return reward
+
+@pytest.fixture(scope="session")
+def leaderboard_users(session_db, hashed_password):
+    """Five ranked users with rewards, shared by the leaderboard tests"""
+    users = [
+        User(
+            username=f"leaderuser{i}",
+            email=f"leader{i}@example.com",
+            hashed_password=hashed_password,
+            is_active=True,
+            points=(i + 1) * 1000  # 1000 ... 5000 points
+        )
+        for i in range(5)
+    ]
+    # return_defaults fetches the ids the rewards need
+    session_db.bulk_save_objects(users, return_defaults=True)
+    session_db.bulk_save_objects([
+        Reward(
+            user_id=user.id,
+            points=100 * (j + 1),
+            bill_amount=D100,
+            category="utilities",
+            on_time_payment=True
+        )
+        for i, user in enumerate(users)
+        for j in range(i + 1)  # User i gets i+1 rewards
+    ])
+    session_db.commit()
+    return users
+
+@pytest.fixture
+def new_user(db, hashed_password):
+    """User with no rewards yet, for tests that assert exact totals.
+
+    The shared test_user also owns test_reward, so its totals depend on
+    which fixtures have already run.
+    """
+    user = User(
+        username="newrewarduser",
+        email="newreward@example.com",
+        hashed_password=hashed_password,
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+    return user
@@ -3,6 +3,10 @@ from fastapi.testclient import TestClient
 
 from app.tests.test_auth import client, test_db
 
+# These tests share the user registered in test_create_account, so keep
+# them on one worker; run in parallel with ``pytest -n auto --dist loadgroup``
+pytestmark = pytest.mark.xdist_group("accounts")
+
 def test_create_account(test_db):
     """Test creating an account"""
     # First login to get token
@@ -1,36 +1,17 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from app.main import app
-from app.core.database import Base, get_db
-from app.core.config import settings
-
-# Test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-# Override get_db dependency
-def override_get_db():
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-app.dependency_overrides[get_db] = override_get_db
 
 client = TestClient(app)
 
 @pytest.fixture(scope="module")
-def test_db():
-    Base.metadata.create_all(bind=engine)
+def test_db(connection):
+    """Isolate the module's writes in one SAVEPOINT on the shared test schema"""
+    nested = connection.begin_nested()
     yield
-    Base.metadata.drop_all(bind=engine)
+    if nested.is_active:
+        nested.rollback()
 
 def test_register_user(test_db):
     """Test user registration"""
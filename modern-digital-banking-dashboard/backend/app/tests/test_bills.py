@@ -1,18 +1,19 @@
 import pytest
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, AsyncMock
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.main import app
-from app.database import Base, get_db
 from app.models.bill import Bill, BillFrequency, CurrencyCode
 from app.models.user import User
 from app.schemas.bill import BillCreate, BillUpdate
 from app.crud.bill import bill_crud
-from app.core.auth import create_access_token, verify_password, get_password_hash
-from app.tests.conftest import TestingSessionLocal, override_get_db
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.tests.utils import D100, D150, D200, D250, D1200
 
 client = TestClient(app)
 
@@ -35,13 +36,22 @@ TEST_BILL_DATA = {
     "reminder_days": 3
 }
 
+# JSON-ready request payload, built once instead of per test
+TEST_BILL_JSON = {
+    **TEST_BILL_DATA,
+    "due_date": TEST_BILL_DATA["due_date"].isoformat(),
+    "amount": str(TEST_BILL_DATA["amount"]),
+    "currency": TEST_BILL_DATA["currency"].value,
+    "frequency": TEST_BILL_DATA["frequency"].value
+}
+
 @pytest.fixture
-def test_user(db: Session):
+def test_user(db: Session, hashed_password):
     """Create a test user"""
     user = User(
         username=TEST_USER_DATA["username"],
         email=TEST_USER_DATA["email"],
-        hashed_password=get_password_hash(TEST_USER_DATA["password"]),
+        hashed_password=hashed_password,
         full_name=TEST_USER_DATA["full_name"],
         is_active=True
     )
@@ -50,10 +60,15 @@ def test_user(db: Session):
     db.refresh(user)
     return user
 
-@pytest.fixture
-def auth_headers(test_user):
-    """Create authentication headers"""
-    access_token = create_access_token(data={"sub": test_user.email})
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Create authentication headers, signed once per test session"""
+    access_token = create_access_token(
+        data={"sub": TEST_USER_DATA["username"]},
+        expires_delta=timedelta(hours=2),  # Outlive the whole test run
+        secret_key=settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM
+    )
     return {"Authorization": f"Bearer {access_token}"}
 
 @pytest.fixture
@@ -67,73 +82,70 @@ def test_bill(db: Session, test_user):
     db.refresh(bill)
     return bill
 
+@pytest.fixture(scope="session")
+def seeded_bills(session_db: Session, hashed_password):
+    """Insert one shared batch of bills for the read-only CRUD query tests"""
+    owner = User(
+        username="billseeduser",
+        email="billseed@example.com",
+        hashed_password=hashed_password,
+        is_active=True
+    )
+    session_db.add(owner)
+    session_db.flush()
+    
+    today = date.today()
+    bills = [
+        Bill(
+            name=f"Bill due in {days} days",
+            amount=D100,
+            currency=CurrencyCode.USD,
+            amount_usd=D100,
+            due_date=today + timedelta(days=days),
+            category="utilities",
+            user_id=owner.id
+        )
+        for days in [-5, 1, 3, 7, 10, 14]
+    ]
+    session_db.bulk_save_objects(bills)
+    session_db.commit()
+    return bills
+
 class TestBillAPI:
     """Test cases for Bill API endpoints"""
     
     def test_create_bill_success(self, db: Session, test_user, auth_headers):
         """Test creating a new bill"""
-        bill_data = TEST_BILL_DATA.copy()
-        bill_data["due_date"] = str(bill_data["due_date"])
-        bill_data["amount"] = str(bill_data["amount"])
-        
         response = client.post(
             "/api/v1/bills/",
-            json=bill_data,
+            json=TEST_BILL_JSON,
             headers=auth_headers
         )
         
         assert response.status_code == 201
         data = response.json()
         
-        assert data["name"] == bill_data["name"]
-        assert data["amount"] == bill_data["amount"]
-        assert data["currency"] == bill_data["currency"]
+        assert data["name"] == TEST_BILL_JSON["name"]
+        assert data["amount"] == TEST_BILL_JSON["amount"]
+        assert data["currency"] == TEST_BILL_JSON["currency"]
         assert data["user_id"] == test_user.id
         assert data["is_paid"] == False
         
         # Verify bill was created in database
-        bill = db.query(Bill).filter(Bill.id == data["id"]).first()
+        bill = db.get(Bill, data["id"])
         assert bill is not None
-        assert bill.name == bill_data["name"]
+        assert bill.name == TEST_BILL_JSON["name"]
     
-    def test_create_bill_with_currency_conversion(self, db: Session, test_user, auth_headers):
+    def test_create_bill_with_currency_conversion(self, db: Session, test_user, auth_headers, _mock_currency, today):
         """Test creating bill with non-USD currency"""
-        with patch('app.services.currency_service.convert_currency') as mock_convert:
-            mock_convert.return_value = Decimal("135.45")  # Mock conversion rate
-            
-            bill_data = {
-                "name": "International Bill",
-                "amount": "100.00",
-                "currency": "EUR",
-                "due_date": str(date.today() + timedelta(days=15)),
-                "category": "subscription",
-                "frequency": "monthly"
-            }
-            
-            response = client.post(
-                "/api/v1/bills/",
-                json=bill_data,
-                headers=auth_headers
-            )
-            
-            assert response.status_code == 201
-            data = response.json()
-            
-            # Verify conversion was called
-            mock_convert.assert_called_once()
-            
-            # Verify USD amount is stored
-            assert data["amount_usd"] == "135.45"
-    
-    def test_create_bill_invalid_data(self, db: Session, test_user, auth_headers):
-        """Test creating bill with invalid data"""
-        # Test with past due date
+        _mock_currency.reset_mock()
+        
         bill_data = {
-            "name": "Past Due Bill",
+            "name": "International Bill",
             "amount": "100.00",
-            "currency": "USD",
-            "due_date": str(date.today() - timedelta(days=1)),
-            "category": "utilities",
+            "currency": "EUR",
+            "due_date": str(today + timedelta(days=15)),
+            "category": "subscription",
             "frequency": "monthly"
         }
         
@@ -143,11 +155,30 @@ class TestBillAPI:
             headers=auth_headers
         )
         
-        assert response.status_code == 422  # Validation error
+        assert response.status_code == 201
+        data = response.json()
         
-        # Test with negative amount
-        bill_data["due_date"] = str(date.today() + timedelta(days=10))
-        bill_data["amount"] = "-50.00"
+        # Verify conversion was called
+        _mock_currency.assert_called_once()
+        
+        # Verify USD amount is stored
+        assert data["amount_usd"] == "135.45"
+    
+    @pytest.mark.parametrize("field,bad_value", [
+        ("due_date", str(date.today() - timedelta(days=1))),  # Past due date
+        ("amount", "-50.00"),  # Negative amount
+    ])
+    def test_create_bill_invalid_data(self, db: Session, test_user, auth_headers, field, bad_value, today):
+        """Test creating bill with invalid data"""
+        bill_data = {
+            "name": "Invalid Bill",
+            "amount": "100.00",
+            "currency": "USD",
+            "due_date": str(today + timedelta(days=10)),
+            "category": "utilities",
+            "frequency": "monthly",
+            field: bad_value
+        }
         
         response = client.post(
             "/api/v1/bills/",
@@ -155,7 +186,7 @@ class TestBillAPI:
             headers=auth_headers
         )
         
-        assert response.status_code == 422
+        assert response.status_code == 422  # Validation error
     
     def test_get_bills(self, db: Session, test_user, auth_headers, test_bill):
         """Test retrieving bills"""
@@ -174,20 +205,20 @@ class TestBillAPI:
         bill_ids = [bill["id"] for bill in data]
         assert test_bill.id in bill_ids
     
-    def test_get_bills_with_filters(self, db: Session, test_user, auth_headers, test_bill):
+    def test_get_bills_with_filters(self, db: Session, test_user, auth_headers, test_bill, today):
         """Test retrieving bills with filters"""
         # Create another bill with different category
         other_bill = Bill(
             name="Rent",
-            amount=Decimal("1200.00"),
+            amount=D1200,
             currency=CurrencyCode.USD,
-            amount_usd=Decimal("1200.00"),
-            due_date=date.today() + timedelta(days=5),
+            amount_usd=D1200,
+            due_date=today + timedelta(days=5),
             category="rent",
             user_id=test_user.id
         )
         db.add(other_bill)
-        db.commit()
+        db.flush()
         
         # Filter by category
         response = client.get(
@@ -235,13 +266,13 @@ class TestBillAPI:
         
         assert response.status_code == 404
     
-    def test_get_bill_unauthorized(self, db: Session, test_user, auth_headers):
+    def test_get_bill_unauthorized(self, db: Session, test_user, auth_headers, today, hashed_password):
         """Test retrieving another user's bill"""
         # Create another user
         other_user = User(
             username="otheruser",
             email="other@example.com",
-            hashed_password=get_password_hash("password123"),
+            hashed_password=hashed_password,
             is_active=True
         )
         db.add(other_user)
@@ -250,10 +281,10 @@ class TestBillAPI:
         # Create bill for other user
         other_bill = Bill(
             name="Other User Bill",
-            amount=Decimal("100.00"),
+            amount=D100,
             currency=CurrencyCode.USD,
-            amount_usd=Decimal("100.00"),
-            due_date=date.today() + timedelta(days=10),
+            amount_usd=D100,
+            due_date=today + timedelta(days=10),
             category="utilities",
             user_id=other_user.id
         )
@@ -267,32 +298,48 @@ class TestBillAPI:
         
         assert response.status_code == 403
     
-    def test_update_bill(self, db: Session, test_user, auth_headers, test_bill):
-        """Test updating a bill"""
+    @pytest.mark.parametrize("driver", ["api", "crud"])
+    def test_update_bill(self, db: Session, test_user, auth_headers, test_bill, today, driver):
+        """Test updating a bill through the API and through CRUD"""
         update_data = {
             "name": "Updated Electricity Bill",
             "amount": "175.75",
-            "due_date": str(date.today() + timedelta(days=15))
+            "due_date": str(today + timedelta(days=15)),
+            "is_paid": True
         }
         
-        response = client.put(
-            f"/api/v1/bills/{test_bill.id}",
-            json=update_data,
-            headers=auth_headers
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert data["name"] == update_data["name"]
-        assert data["amount"] == update_data["amount"]
+        if driver == "api":
+            response = client.put(
+                f"/api/v1/bills/{test_bill.id}",
+                json=update_data,
+                headers=auth_headers
+            )
+            
+            assert response.status_code == 200
+            data = response.json()
+            
+            assert data["name"] == update_data["name"]
+            assert data["amount"] == update_data["amount"]
+            
+            # Verify update in database (the API wrote through its own session)
+            db.refresh(test_bill)
+        else:
+            bill_crud.update(
+                db=db,
+                db_obj=test_bill,
+                obj_in={
+                    **update_data,
+                    "amount": Decimal(update_data["amount"]),
+                    "due_date": today + timedelta(days=15)
+                }
+            )
         
-        # Verify update in database
-        db.refresh(test_bill)
         assert test_bill.name == update_data["name"]
         assert test_bill.amount == Decimal(update_data["amount"])
+        assert test_bill.is_paid == True
+        assert test_bill.paid_date == today
     
-    def test_update_bill_mark_as_paid(self, db: Session, test_user, auth_headers, test_bill):
+    def test_update_bill_mark_as_paid(self, db: Session, test_user, auth_headers, test_bill, today):
         """Test marking a bill as paid"""
         update_data = {"is_paid": True}
         
@@ -308,43 +355,50 @@ class TestBillAPI:
         assert data["is_paid"] == True
         assert data["paid_date"] is not None
         
-        # Verify in database
+        # Verify in database (the API wrote through its own session)
         db.refresh(test_bill)
         assert test_bill.is_paid == True
-        assert test_bill.paid_date == date.today()
+        assert test_bill.paid_date == today
     
-    def test_delete_bill(self, db: Session, test_user, auth_headers, test_bill):
-        """Test deleting a bill"""
-        response = client.delete(
-            f"/api/v1/bills/{test_bill.id}",
-            headers=auth_headers
-        )
+    @pytest.mark.parametrize("driver", ["api", "crud"])
+    def test_delete_bill(self, db: Session, test_user, auth_headers, test_bill, driver):
+        """Test deleting a bill through the API and through CRUD"""
+        bill_id = test_bill.id
         
-        assert response.status_code == 204
+        if driver == "api":
+            response = client.delete(
+                f"/api/v1/bills/{bill_id}",
+                headers=auth_headers
+            )
+            
+            assert response.status_code == 204
+        else:
+            deleted_bill = bill_crud.remove(db=db, id=bill_id)
+            
+            assert deleted_bill.id == bill_id
         
-        # Verify deletion from database
-        bill = db.query(Bill).filter(Bill.id == test_bill.id).first()
+        # Verify deletion from database (bypass the stale identity map entry)
+        bill = db.get(Bill, bill_id, populate_existing=True)
         assert bill is None
     
-    def test_get_due_soon_bills(self, db: Session, test_user, auth_headers):
+    def test_get_due_soon_bills(self, db: Session, test_user, auth_headers, today):
         """Test getting bills due soon"""
-        # Create bills with different due dates
-        bills = [
-            Bill(
-                name=f"Bill {i}",
-                amount=Decimal("100.00"),
-                currency=CurrencyCode.USD,
-                amount_usd=Decimal("100.00"),
-                due_date=date.today() + timedelta(days=i),
-                category="utilities",
-                user_id=test_user.id
-            )
-            for i in range(1, 11)
-        ]
-        
-        for bill in bills:
-            db.add(bill)
-        db.commit()
+        # Create bills with different due dates in a single executemany
+        db.execute(
+            insert(Bill.__table__),
+            [
+                {
+                    "name": f"Bill {i}",
+                    "amount": D100,
+                    "currency": CurrencyCode.USD,
+                    "amount_usd": D100,
+                    "due_date": today + timedelta(days=i),
+                    "category": "utilities",
+                    "user_id": test_user.id
+                }
+                for i in range(1, 11)
+            ]
+        )
         
         response = client.get(
             "/api/v1/bills/summary/due-soon?days=7",
@@ -360,20 +414,18 @@ class TestBillAPI:
         # Verify dates are in range
         for bill in data:
             due_date = datetime.fromisoformat(bill["due_date"]).date()
-            days_until = (due_date - date.today()).days
+            days_until = (due_date - today).days
             assert 1 <= days_until <= 7
     
-    def test_get_monthly_summary(self, db: Session, test_user, auth_headers):
+    def test_get_monthly_summary(self, db: Session, test_user, auth_headers, today):
         """Test getting monthly bill summary"""
-        today = date.today()
-        
         # Create bills for current month
         bills = [
             Bill(
                 name="Paid Bill",
-                amount=Decimal("100.00"),
+                amount=D100,
                 currency=CurrencyCode.USD,
-                amount_usd=Decimal("100.00"),
+                amount_usd=D100,
                 due_date=today,
                 category="utilities",
                 is_paid=True,
@@ -382,9 +434,9 @@ class TestBillAPI:
             ),
             Bill(
                 name="Unpaid Bill",
-                amount=Decimal("200.00"),
+                amount=D200,
                 currency=CurrencyCode.USD,
-                amount_usd=Decimal("200.00"),
+                amount_usd=D200,
                 due_date=today,
                 category="rent",
                 is_paid=False,
@@ -394,7 +446,7 @@ class TestBillAPI:
         
         for bill in bills:
             db.add(bill)
-        db.commit()
+        db.flush()
         
         response = client.get(
             f"/api/v1/bills/summary/monthly?month={today.month}&year={today.year}",
@@ -423,7 +475,7 @@ class TestBillAPI:
         assert data["is_paid"] == True
         assert data["paid_date"] is not None
         
-        # Verify in database
+        # Verify in database (the API wrote through its own session)
         db.refresh(test_bill)
         assert test_bill.is_paid == True
 
@@ -455,129 +507,50 @@ class TestBillCRUD:
         assert bill.id == test_bill.id
         assert bill.name == test_bill.name
     
-    def test_get_multi_bills(self, db: Session, test_user):
-        """Test getting multiple bills via CRUD"""
-        # Create multiple bills
-        for i in range(5):
-            bill = Bill(
-                name=f"Test Bill {i}",
-                amount=Decimal("100.00"),
-                currency=CurrencyCode.USD,
-                amount_usd=Decimal("100.00"),
-                due_date=date.today() + timedelta(days=i),
-                category="utilities",
-                user_id=test_user.id
+    @pytest.mark.parametrize("query,expected_days", [
+        ("get_multi", [-5, 1, 3, 7, 10, 14]),
+        ("get_due_soon", [1, 3, 7]),
+        ("get_overdue", [-5]),
+    ])
+    def test_bill_queries(self, db: Session, seeded_bills, query, expected_days, today):
+        """Test get_multi / get_due_soon / get_overdue via CRUD"""
+        owner_id = seeded_bills[0].user_id
+        
+        if query == "get_multi":
+            bills = bill_crud.get_multi(
+                db=db,
+                skip=0,
+                limit=10,
+                filters={"user_id": owner_id}
             )
-            db.add(bill)
-        db.commit()
-        
-        bills = bill_crud.get_multi(
-            db=db,
-            skip=0,
-            limit=10,
-            filters={"user_id": test_user.id}
-        )
-        
-        assert len(bills) >= 5
-    
-    def test_update_bill(self, db: Session, test_bill):
-        """Test updating a bill via CRUD"""
-        update_data = {
-            "name": "Updated Bill Name",
-            "amount": Decimal("200.00"),
-            "is_paid": True
-        }
-        
-        updated_bill = bill_crud.update(
-            db=db,
-            db_obj=test_bill,
-            obj_in=update_data
-        )
-        
-        assert updated_bill.name == update_data["name"]
-        assert updated_bill.amount == update_data["amount"]
-        assert updated_bill.is_paid == update_data["is_paid"]
-        assert updated_bill.paid_date == date.today()
-    
-    def test_delete_bill(self, db: Session, test_bill):
-        """Test deleting a bill via CRUD"""
-        bill_id = test_bill.id
-        
-        deleted_bill = bill_crud.remove(db=db, id=bill_id)
-        
-        assert deleted_bill.id == bill_id
-        
-        # Verify it's deleted
-        bill = bill_crud.get(db=db, id=bill_id)
-        assert bill is None
-    
-    def test_get_due_soon(self, db: Session, test_user):
-        """Test getting due soon bills via CRUD"""
-        today = date.today()
-        
-        # Create bills with different due dates
-        bills = []
-        for days in [1, 3, 7, 10, 14]:
-            bill = Bill(
-                name=f"Bill due in {days} days",
-                amount=Decimal("100.00"),
-                currency=CurrencyCode.USD,
-                amount_usd=Decimal("100.00"),
-                due_date=today + timedelta(days=days),
-                category="utilities",
-                user_id=test_user.id
+        elif query == "get_due_soon":
+            bills = bill_crud.get_due_soon(
+                db=db,
+                user_id=owner_id,
+                start_date=today,
+                end_date=today + timedelta(days=7),
+                include_overdue=False
             )
-            db.add(bill)
-            bills.append(bill)
-        db.commit()
-        
-        # Get bills due in next 7 days
-        due_soon = bill_crud.get_due_soon(
-            db=db,
-            user_id=test_user.id,
-            start_date=today,
-            end_date=today + timedelta(days=7)
-        )
+        else:
+            bills = bill_crud.get_overdue(db=db, user_id=owner_id)
         
-        # Should get bills due in 1, 3, and 7 days
-        assert len(due_soon) == 3
+        assert sorted(bill.days_until_due for bill in bills) == expected_days
         
         # Verify they're not paid
-        assert all(not bill.is_paid for bill in due_soon)
-    
-    def test_get_overdue_bills(self, db: Session, test_user):
-        """Test getting overdue bills via CRUD"""
-        today = date.today()
-        
-        # Create overdue bill
-        overdue_bill = Bill(
-            name="Overdue Bill",
-            amount=Decimal("100.00"),
-            currency=CurrencyCode.USD,
-            amount_usd=Decimal("100.00"),
-            due_date=today - timedelta(days=5),
-            category="utilities",
-            user_id=test_user.id
-        )
-        db.add(overdue_bill)
-        db.commit()
-        
-        overdue_bills = bill_crud.get_overdue(db=db, user_id=test_user.id)
+        assert all(not bill.is_paid for bill in bills)
         
-        assert len(overdue_bills) == 1
-        assert overdue_bills[0].id == overdue_bill.id
-        assert overdue_bills[0].is_overdue == True
+        # Overdue results must also report themselves as overdue
+        if query == "get_overdue":
+            assert all(bill.is_overdue for bill in bills)
     
-    def test_get_monthly_summary(self, db: Session, test_user):
+    def test_get_monthly_summary(self, db: Session, test_user, today):
         """Test getting monthly summary via CRUD"""
-        today = date.today()
-        
         # Create bills for current month
         bill1 = Bill(
             name="Paid Bill",
-            amount=Decimal("150.00"),
+            amount=D150,
             currency=CurrencyCode.USD,
-            amount_usd=Decimal("150.00"),
+            amount_usd=D150,
             due_date=today,
             category="utilities",
             is_paid=True,
@@ -587,9 +560,9 @@ class TestBillCRUD:
         
         bill2 = Bill(
             name="Unpaid Bill",
-            amount=Decimal("250.00"),
+            amount=D250,
             currency=CurrencyCode.USD,
-            amount_usd=Decimal("250.00"),
+            amount_usd=D250,
             due_date=today,
             category="rent",
             is_paid=False,
@@ -597,7 +570,7 @@ class TestBillCRUD:
         )
         
         db.add_all([bill1, bill2])
-        db.commit()
+        db.flush()
         
         summary = bill_crud.get_monthly_summary(
             db=db,
@@ -620,10 +593,10 @@ class TestBillCRUD:
 class TestBillModels:
     """Test cases for Bill model properties"""
     
-    def test_bill_properties(self, test_bill):
+    def test_bill_properties(self, test_bill, today):
         """Test bill calculated properties"""
         # Test days_until_due
-        assert test_bill.days_until_due == (test_bill.due_date - date.today()).days
+        assert test_bill.days_until_due == (test_bill.due_date - today).days
         
         # Test is_overdue (should be False for future due date)
         assert test_bill.is_overdue == False
@@ -631,7 +604,7 @@ class TestBillModels:
         # Test should_remind (depends on reminder_days)
         if test_bill.reminder_days > 0:
             reminder_date = test_bill.due_date - timedelta(days=test_bill.reminder_days)
-            assert test_bill.should_remind == (date.today() >= reminder_date)
+            assert test_bill.should_remind == (today >= reminder_date)
     
     def test_bill_to_dict(self, test_bill):
         """Test bill to_dict method"""
@@ -645,14 +618,14 @@ class TestBillModels:
         assert "is_overdue" in bill_dict
         assert "should_remind" in bill_dict
     
-    def test_overdue_bill(self, db: Session, test_user):
+    def test_overdue_bill(self, db: Session, test_user, today):
         """Test bill marked as overdue"""
         overdue_bill = Bill(
             name="Overdue Bill",
-            amount=Decimal("100.00"),
+            amount=D100,
             currency=CurrencyCode.USD,
-            amount_usd=Decimal("100.00"),
-            due_date=date.today() - timedelta(days=5),
+            amount_usd=D100,
+            due_date=today - timedelta(days=5),
             category="utilities",
             user_id=test_user.id
         )
@@ -660,17 +633,17 @@ class TestBillModels:
         assert overdue_bill.is_overdue == True
         assert overdue_bill.days_until_due < 0
     
-    def test_paid_bill_properties(self, db: Session, test_user):
+    def test_paid_bill_properties(self, db: Session, test_user, today):
         """Test properties of paid bill"""
         paid_bill = Bill(
             name="Paid Bill",
-            amount=Decimal("100.00"),
+            amount=D100,
             currency=CurrencyCode.USD,
-            amount_usd=Decimal("100.00"),
-            due_date=date.today() - timedelta(days=5),
+            amount_usd=D100,
+            due_date=today - timedelta(days=5),
             category="utilities",
             is_paid=True,
-            paid_date=date.today() - timedelta(days=2),
+            paid_date=today - timedelta(days=2),
             user_id=test_user.id
         )
         
@@ -13,6 +13,7 @@ from ..crud.budget import (
     delete_budget
 )
 from ..services.budget_service import BudgetService
+from .utils import D100, D500, D600
 
 
 class TestBudgetCRUD:
@@ -22,7 +23,7 @@ class TestBudgetCRUD:
             name="Groceries",
             category="Food",
             subcategory="Groceries",
-            amount=Decimal("500.00"),
+            amount=D500,
             period=BudgetPeriod.MONTHLY,
             month=11,
             year=2024,
@@ -35,7 +36,7 @@ class TestBudgetCRUD:
         assert budget.user_id == test_user.id
         assert budget.name == "Groceries"
         assert budget.category == "Food"
-        assert budget.amount == Decimal("500.00")
+        assert budget.amount == D500
         assert budget.period == BudgetPeriod.MONTHLY
     
     def test_get_budget(self, db_session, test_user, test_budget):
@@ -70,7 +71,7 @@ class TestBudgetCRUD:
         """Test updating a budget"""
         update_data = BudgetUpdate(
             name="Updated Groceries",
-            amount=Decimal("600.00")
+            amount=D600
         )
         
         updated_budget = update_budget(
@@ -81,7 +82,7 @@ class TestBudgetCRUD:
         )
         
         assert updated_budget.name == "Updated Groceries"
-        assert updated_budget.amount == Decimal("600.00")
+        assert updated_budget.amount == D600
         assert updated_budget.updated_at is not None
     
     def test_delete_budget(self, db_session, test_user, test_budget):
@@ -170,7 +171,7 @@ class TestBudgetValidations:
             BudgetCreate(
                 name="Test Budget",
                 category="Test",
-                amount=Decimal("100.00"),
+                amount=D100,
                 period=BudgetPeriod.MONTHLY,
                 month=None,  # Should raise error
                 year=2024
@@ -182,7 +183,7 @@ class TestBudgetValidations:
             BudgetCreate(
                 name="Test Budget",
                 category="Test",
-                amount=Decimal("100.00"),
+                amount=D100,
                 period=BudgetPeriod.YEARLY,
                 month=11,  # Should raise error
                 year=2024
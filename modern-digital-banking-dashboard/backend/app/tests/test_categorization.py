@@ -36,52 +36,6 @@ class TestCategorizationService:
         assert rule.subcategory == "Coffee"
         assert rule.priority == 5
     
-    def test_match_rule_contains(self, db_session):
-        """Test matching rules with CONTAINS pattern type"""
-        service = CategorizationService(db_session)
-        
-        rule = Mock(spec=CategoryRule)
-        rule.pattern_type = PatternType.CONTAINS
-        rule.pattern = "amazon"
-        
-        # Test positive match
-        assert service.match_rule("AMAZON PURCHASE", rule) is True
-        assert service.match_rule("Purchase from Amazon.com", rule) is True
-        
-        # Test negative match
-        assert service.match_rule("Grocery Store", rule) is False
-    
-    def test_match_rule_exact(self, db_session):
-        """Test matching rules with EXACT pattern type"""
-        service = CategorizationService(db_session)
-        
-        rule = Mock(spec=CategoryRule)
-        rule.pattern_type = PatternType.EXACT
-        rule.pattern = "netflix"
-        
-        # Test exact match (case insensitive)
-        assert service.match_rule("NETFLIX", rule) is True
-        assert service.match_rule("netflix", rule) is True
-        
-        # Test non-exact match
-        assert service.match_rule("NETFLIX SUBSCRIPTION", rule) is False
-    
-    def test_match_rule_regex(self, db_session):
-        """Test matching rules with REGEX pattern type"""
-        service = CategorizationService(db_session)
-        
-        rule = Mock(spec=CategoryRule)
-        rule.pattern_type = PatternType.REGEX
-        rule.pattern = r"uber\s*(?:ride|eats|pool)?"
-        
-        # Test regex matches
-        assert service.match_rule("UBER RIDE", rule) is True
-        assert service.match_rule("Uber Eats Delivery", rule) is True
-        assert service.match_rule("UberPool", rule) is True
-        
-        # Test non-match
-        assert service.match_rule("Taxi Ride", rule) is False
-    
     def test_categorize_transaction(self, db_session, test_user, test_transaction):
         """Test categorizing a transaction with rules"""
         service = CategorizationService(db_session)
@@ -0,0 +1,98 @@
+import pytest
+from unittest.mock import Mock
+
+from ..schemas.categorization import PatternType
+from ..services.categorization import CategorizationService, _compile_rule
+
+
+def make_rule(pattern_type, pattern):
+    """Stand-in for a stored categorization rule"""
+    rule = Mock()
+    rule.pattern_type = pattern_type
+    rule.pattern = pattern
+    return rule
+
+
+class TestRuleMatching:
+    def test_match_rule_contains(self, db):
+        """Test matching rules with CONTAINS pattern type"""
+        service = CategorizationService(db)
+        
+        rule = make_rule(PatternType.CONTAINS, "amazon")
+        
+        # Test positive match
+        assert service.match_rule("AMAZON PURCHASE", rule) is True
+        assert service.match_rule("Purchase from Amazon.com", rule) is True
+        
+        # Test negative match
+        assert service.match_rule("Grocery Store", rule) is False
+    
+    def test_match_rule_exact(self, db):
+        """Test matching rules with EXACT pattern type"""
+        service = CategorizationService(db)
+        
+        rule = make_rule(PatternType.EXACT, "netflix")
+        
+        # Test exact match (case insensitive)
+        assert service.match_rule("NETFLIX", rule) is True
+        assert service.match_rule("netflix", rule) is True
+        
+        # Test non-exact match
+        assert service.match_rule("NETFLIX SUBSCRIPTION", rule) is False
+    
+    def test_match_rule_regex(self, db):
+        """Test matching rules with REGEX pattern type"""
+        service = CategorizationService(db)
+        
+        rule = make_rule(PatternType.REGEX, r"uber\s*(?:ride|eats|pool)?")
+        
+        # Test regex matches
+        assert service.match_rule("UBER RIDE", rule) is True
+        assert service.match_rule("Uber Eats Delivery", rule) is True
+        assert service.match_rule("UberPool", rule) is True
+        
+        # Test non-match
+        assert service.match_rule("Taxi Ride", rule) is False
+    
+    def test_regex_compiled_once(self, db):
+        """Test that a regex pattern is compiled once, not per match"""
+        service = CategorizationService(db)
+        
+        rule = make_rule(PatternType.REGEX, r"^shell\b")
+        _compile_rule.cache_clear()
+        
+        for i in range(10):
+            service.match_rule(f"SHELL GAS STATION #{i}", rule)
+        
+        info = _compile_rule.cache_info()
+        assert (info.misses, info.hits) == (1, 9)
+    
+    @pytest.mark.parametrize("pattern_type", [
+        PatternType.CONTAINS,
+        PatternType.EXACT,
+        PatternType.STARTS_WITH,
+        PatternType.ENDS_WITH,
+    ])
+    def test_match_rule_mixed_case_pattern(self, db, pattern_type):
+        """Test that stored patterns match regardless of their case"""
+        service = CategorizationService(db)
+        
+        rule = make_rule(pattern_type, "Whole Foods")
+        
+        assert service.match_rule("WHOLE FOODS", rule) is True
+    
+    def test_match_rules_batch(self, db):
+        """Test picking the first matching rule for a batch of descriptions"""
+        service = CategorizationService(db)
+        
+        coffee = make_rule(PatternType.STARTS_WITH, "Starbucks")
+        shopping = make_rule(PatternType.CONTAINS, "amazon")
+        fallback = make_rule(PatternType.CONTAINS, "store")
+        
+        matches = service.match_rules(
+            ["STARBUCKS #12", "Amazon Store", "Corner Store", "Unknown", None],
+            [coffee, shopping, fallback]
+        )
+        
+        # Rules are tried in order, so "Amazon Store" goes to shopping
+        assert matches == [coffee, shopping, fallback, None, None]
@@ -5,13 +5,15 @@ import pytest
 import csv
 import json
 from datetime import datetime, timedelta
+from decimal import Decimal
 from io import StringIO
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.models.transaction import Transaction, TransactionType
+from app.models.transaction import Transaction, TransactionType, TransactionStatus
+from app.models.user import User
 from app.models.account import Account, AccountType
-from app.services.export_service import ExportService
+from app.services.export_service import ExportService, remove_export_files
 from app.schemas.export import ExportRequest, ExportFormat, ExportType
 
 def test_transactions_csv_export(db: Session, test_user: User):
@@ -19,18 +21,18 @@ def test_transactions_csv_export(db: Session, test_user: User):
     export_service = ExportService(db, test_user.id)
     
     # Create test transactions
-    for i in range(3):
-        transaction = Transaction(
+    db.bulk_save_objects([
+        Transaction(
             user_id=test_user.id,
             description=f"Transaction {i}",
             amount=100.00 * (i + 1),
-            transaction_type=TransactionType.INCOME if i % 2 == 0 else TransactionType.EXPENSE,
+            transaction_type=TransactionType.CREDIT if i % 2 == 0 else TransactionType.DEBIT,
             category=f"Category {i % 2}",
             date=datetime.now() - timedelta(days=i),
             status="completed"
         )
-        db.add(transaction)
-    
+        for i in range(3)
+    ])
     db.commit()
     
     # Generate CSV export
@@ -39,7 +41,7 @@ def test_transactions_csv_export(db: Session, test_user: User):
     )
     
     # Parse CSV to verify content
-    csv_reader = csv.reader(StringIO(csv_content))
+    csv_reader = csv.reader(StringIO(csv_content.decode("utf-8")))
     rows = list(csv_reader)
     
     assert len(rows) == 4  # Header + 3 transactions
@@ -57,8 +59,8 @@ def test_accounts_csv_export(db: Session, test_user: User):
     # Create test accounts
     account_types = [AccountType.CHECKING, AccountType.SAVINGS, AccountType.CREDIT_CARD]
     
-    for i, account_type in enumerate(account_types):
-        account = Account(
+    db.bulk_save_objects([
+        Account(
             user_id=test_user.id,
             name=f"Test Account {i}",
             account_type=account_type,
@@ -66,8 +68,8 @@ def test_accounts_csv_export(db: Session, test_user: User):
             currency="USD",
             is_active=True
         )
-        db.add(account)
-    
+        for i, account_type in enumerate(account_types)
+    ])
     db.commit()
     
     # Generate CSV export
@@ -76,7 +78,7 @@ def test_accounts_csv_export(db: Session, test_user: User):
     )
     
     # Parse CSV
-    csv_reader = csv.reader(StringIO(csv_content))
+    csv_reader = csv.reader(StringIO(csv_content.decode("utf-8")))
     rows = list(csv_reader)
     
     assert len(rows) == 4  # Header + 3 accounts
@@ -99,30 +101,31 @@ def test_cash_flow_json_export(db: Session, test_user: User):
     end_date = datetime.now()
     
     # Create test transactions
-    for i in range(5):
-        transaction = Transaction(
+    incomes = [
+        Transaction(
             user_id=test_user.id,
             description=f"Income {i}",
             amount=1000.00,
-            transaction_type=TransactionType.INCOME,
+            transaction_type=TransactionType.CREDIT,
             category="Salary",
             date=start_date + timedelta(days=i * 7),
             status="completed"
         )
-        db.add(transaction)
-    
-    for i in range(10):
-        transaction = Transaction(
+        for i in range(5)
+    ]
+    expenses = [
+        Transaction(
             user_id=test_user.id,
             description=f"Expense {i}",
             amount=-100.00,
-            transaction_type=TransactionType.EXPENSE,
+            transaction_type=TransactionType.DEBIT,
             category="Food",
             date=start_date + timedelta(days=i * 3),
             status="completed"
         )
-        db.add(transaction)
-    
+        for i in range(10)
+    ]
+    db.bulk_save_objects(incomes + expenses)
     db.commit()
     
     # Generate JSON export
@@ -143,9 +146,10 @@ def test_cash_flow_json_export(db: Session, test_user: User):
     assert "category_breakdown" in data
     assert "transactions" in data
     
-    assert data["total_income"] == 5000.00  # 5 * 1000
-    assert data["total_expenses"] == 1000.00  # 10 * 100
-    assert data["net_cash_flow"] == 4000.00
+    # Money stays Decimal, which the JSON export writes as a string
+    assert Decimal(data["total_income"]) == 5000  # 5 * 1000
+    assert Decimal(data["total_expenses"]) == 1000  # 10 * 100
+    assert Decimal(data["net_cash_flow"]) == 4000
     
     # Verify category breakdown
     categories = [item["category"] for item in data["category_breakdown"]]
@@ -156,18 +160,18 @@ def test_generate_export(db: Session, test_user: User):
     export_service = ExportService(db, test_user.id)
     
     # Create test data
-    for i in range(3):
-        transaction = Transaction(
+    db.bulk_save_objects([
+        Transaction(
             user_id=test_user.id,
             description=f"Export Test {i}",
             amount=50.00,
-            transaction_type=TransactionType.EXPENSE,
+            transaction_type=TransactionType.DEBIT,
             category="Test",
             date=datetime.now() - timedelta(days=i),
             status="completed"
         )
-        db.add(transaction)
-    
+        for i in range(3)
+    ])
     db.commit()
     
     # Create export request
@@ -274,29 +278,28 @@ def test_financial_summary_export(db: Session, test_user: User):
     # Create test transactions
     now = datetime.now()
     
+    transactions = []
     for i in range(3):
-        transaction = Transaction(
+        transactions.append(Transaction(
             user_id=test_user.id,
             description=f"Monthly Income {i}",
             amount=3000.00,
-            transaction_type=TransactionType.INCOME,
+            transaction_type=TransactionType.CREDIT,
             category="Salary",
             date=datetime(now.year, now.month, 15) - timedelta(days=i * 30),
             status="completed"
-        )
-        db.add(transaction)
-        
-        transaction = Transaction(
+        ))
+        transactions.append(Transaction(
             user_id=test_user.id,
             description=f"Monthly Expense {i}",
             amount=-2000.00,
-            transaction_type=TransactionType.EXPENSE,
+            transaction_type=TransactionType.DEBIT,
             category="Living",
             date=datetime(now.year, now.month, 20) - timedelta(days=i * 30),
             status="completed"
-        )
-        db.add(transaction)
+        ))
     
+    db.bulk_save_objects(transactions)
     db.commit()
     
     # Generate summary
@@ -315,6 +318,68 @@ def test_financial_summary_export(db: Session, test_user: User):
     assert metrics["total_expenses"] == 6000.00  # 3 * 2000
     assert metrics["net_cash_flow"] == 3000.00
 
+def test_sql_cash_flow(db: Session, test_user: User):
+    """Test the SQL aggregation behind the financial summary"""
+    export_service = ExportService(db, test_user.id)
+    
+    account = Account(
+        user_id=test_user.id,
+        account_number="EXP-CASHFLOW-1",
+        account_type="checking"
+    )
+    db.add(account)
+    db.flush()
+    
+    today = datetime.now().date()
+    
+    def transaction(amount, transaction_type, category,
+                    status=TransactionStatus.COMPLETED, date=today):
+        return Transaction(
+            user_id=test_user.id,
+            account_id=account.id,
+            amount=amount,
+            transaction_type=transaction_type,
+            category=category,
+            date=date,
+            status=status
+        )
+    
+    db.bulk_save_objects([
+        transaction(1000.00, TransactionType.CREDIT, "Salary"),
+        transaction(500.00, TransactionType.DEPOSIT, "Salary"),
+        transaction(-100.00, TransactionType.DEBIT, "Food"),
+        transaction(-50.00, TransactionType.PAYMENT, "Food"),
+        transaction(-25.00, TransactionType.WITHDRAWAL, None),
+        transaction(200.00, TransactionType.TRANSFER, "Savings"),
+        transaction(-999.00, TransactionType.DEBIT, "Food", status=TransactionStatus.PENDING),
+        transaction(-999.00, TransactionType.DEBIT, "Food", date=today - timedelta(days=10)),
+    ])
+    db.commit()
+    
+    start = datetime.combine(today - timedelta(days=1), datetime.min.time())
+    end = start + timedelta(days=2)
+    groups = {
+        (transaction_type, category): (amount, count)
+        for amount, category, transaction_type, count in export_service._sql_cash_flow(start, end)
+    }
+    
+    # Expenses are summed as absolute amounts; pending and out-of-range
+    # rows are left out
+    assert groups[(TransactionType.DEBIT, "Food")] == (100, 1)
+    assert groups[(TransactionType.PAYMENT, "Food")] == (50, 1)
+    assert groups[(TransactionType.WITHDRAWAL, "Uncategorized")] == (25, 1)
+    assert groups[(TransactionType.CREDIT, "Salary")] == (1000, 1)
+    
+    # The summary classifies the SQL groups into income and expenses
+    summary = export_service._calculate_financial_summary(None, start, end)
+    
+    metrics = summary["metrics"]
+    assert metrics["total_income"] == 1500  # credit + deposit
+    assert metrics["total_expenses"] == 175  # debit + payment + withdrawal
+    assert metrics["income_transactions"] == 2
+    assert metrics["expense_transactions"] == 3
+    assert summary["top_categories"][0] == {"category": "Food", "amount": 150}
+
 def test_api_generate_export(client: TestClient, test_user_headers: dict):
     """Test API endpoint for generating exports"""
     export_data = {
@@ -396,7 +461,7 @@ def test_export_service_edge_cases(db: Session, test_user: User):
     
     # Test with no data
     empty_csv = export_service._transactions_to_csv([])
-    csv_reader = csv.reader(StringIO(empty_csv))
+    csv_reader = csv.reader(StringIO(empty_csv.decode("utf-8")))
     rows = list(csv_reader)
     
     assert len(rows) == 1  # Just header
@@ -404,7 +469,7 @@ def test_export_service_edge_cases(db: Session, test_user: User):
     
     # Test with empty accounts
     empty_accounts_csv = export_service._accounts_to_csv([])
-    csv_reader = csv.reader(StringIO(empty_accounts_csv))
+    csv_reader = csv.reader(StringIO(empty_accounts_csv.decode("utf-8")))
     rows = list(csv_reader)
     
     assert len(rows) == 1  # Just header
@@ -427,28 +492,26 @@ def test_pdf_summary_generation(db: Session, test_user: User):
     # Create some test data
     now = datetime.now()
     
-    transaction = Transaction(
-        user_id=test_user.id,
-        description="Test Income",
-        amount=5000.00,
-        transaction_type=TransactionType.INCOME,
-        category="Salary",
-        date=now,
-        status="completed"
-    )
-    db.add(transaction)
-    
-    transaction = Transaction(
-        user_id=test_user.id,
-        description="Test Expense",
-        amount=-3000.00,
-        transaction_type=TransactionType.EXPENSE,
-        category="Rent",
-        date=now,
-        status="completed"
-    )
-    db.add(transaction)
-    
+    db.bulk_save_objects([
+        Transaction(
+            user_id=test_user.id,
+            description="Test Income",
+            amount=5000.00,
+            transaction_type=TransactionType.CREDIT,
+            category="Salary",
+            date=now,
+            status="completed"
+        ),
+        Transaction(
+            user_id=test_user.id,
+            description="Test Expense",
+            amount=-3000.00,
+            transaction_type=TransactionType.DEBIT,
+            category="Rent",
+            date=now,
+            status="completed"
+        )
+    ])
     db.commit()
     
     # Generate PDF (might return None in test environment)
@@ -458,9 +521,9 @@ def test_pdf_summary_generation(db: Session, test_user: User):
     # Just check that it doesn't crash
     assert pdf_content is None or isinstance(pdf_content, bytes)
 
-@pytest.fixture
-def test_user(db: Session):
-    """Create a test user"""
+@pytest.fixture(scope="module")
+def test_user(module_db: Session):
+    """Create a test user shared by the whole module"""
     from app.models.user import User
     
     user = User(
@@ -470,15 +533,14 @@ def test_user(db: Session):
         full_name="Test Export User"
     )
     
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    module_db.add(user)
+    module_db.commit()
     
     return user
 
-@pytest.fixture
-def other_user(db: Session):
-    """Create another test user"""
+@pytest.fixture(scope="module")
+def other_user(module_db: Session):
+    """Create another test user shared by the whole module"""
     from app.models.user import User
     
     user = User(
@@ -488,28 +550,18 @@ def other_user(db: Session):
         full_name="Other Export User"
     )
     
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    module_db.add(user)
+    module_db.commit()
     
     return user
 
 @pytest.fixture(autouse=True)
-def cleanup_test_data(db: Session, test_user: User, other_user: User):
-    """Clean up test data after each test"""
+def _clear_exports():
+    """Start and end every test with an empty export cache.
+
+    The module shares its users, so exports left by one test would show
+    up in the next one's history.
+    """
+    remove_export_files()
     yield
-    
-    # Delete test transactions
-    db.query(Transaction).filter(Transaction.user_id == test_user.id).delete()
-    db.query(Transaction).filter(Transaction.user_id == other_user.id).delete()
-    
-    # Delete test accounts
-    db.query(Account).filter(Account.user_id == test_user.id).delete()
-    db.query(Account).filter(Account.user_id == other_user.id).delete()
-    
-    db.commit()
-    
-    # Delete test users
-    db.query(User).filter(User.id == test_user.id).delete()
-    db.query(User).filter(User.id == other_user.id).delete()
-    db.commit()
\ No newline at end of file
+    remove_export_files()
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
 from app.services.insight_service import InsightService
 
 def test_cash_flow_insights(db: Session, test_user: User):
@@ -0,0 +1,264 @@
+import pytest
+from datetime import timedelta
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.reward import Reward
+from app.crud.reward import reward_crud
+from app.tests.utils import TEST_REWARD_DATA, count_queries, D100, D150, D200
+
+
+class TestRewardCRUD:
+    """Test cases for Reward CRUD operations"""
+    
+    def test_create_reward(self, db: Session, test_user):
+        """Test creating a reward via CRUD"""
+        reward_data = TEST_REWARD_DATA.copy()
+        reward_data["user_id"] = test_user.id
+        reward_data["points"] = 150
+        
+        reward = reward_crud.create(
+            db=db,
+            obj_in=reward_data
+        )
+        
+        assert reward.id is not None
+        assert reward.user_id == test_user.id
+        assert reward.points == 150
+        assert reward.category == reward_data["category"]
+    
+    def test_get_reward(self, db: Session, test_reward):
+        """Test getting a reward via CRUD"""
+        reward = reward_crud.get(db=db, id=test_reward.id)
+        
+        assert reward is not None
+        assert reward.id == test_reward.id
+        assert reward.points == test_reward.points
+    
+    def test_get_multi_rewards(self, db: Session, test_user):
+        """Test getting multiple rewards via CRUD"""
+        # Create multiple rewards
+        db.bulk_save_objects([
+            Reward(
+                user_id=test_user.id,
+                points=100 + i * 50,
+                bill_amount=D100,
+                category=f"category_{i % 3}",
+                on_time_payment=(i % 2 == 0)
+            )
+            for i in range(5)
+        ])
+        db.commit()
+        
+        rewards = reward_crud.get_multi(
+            db=db,
+            skip=0,
+            limit=10,
+            filters={"user_id": test_user.id}
+        )
+        
+        assert len(rewards) >= 5
+    
+    def test_get_total_points(self, db: Session, new_user):
+        """Test getting total points for a user"""
+        # Create rewards with different points
+        rewards = [
+            Reward(
+                user_id=new_user.id,
+                points=points,
+                bill_amount=D100,
+                category="utilities",
+                on_time_payment=True
+            )
+            for points in [100, 200, 300]
+        ]
+        
+        db.bulk_save_objects(rewards)
+        db.commit()
+        
+        total_points = reward_crud.get_total_points(db=db, user_id=new_user.id)
+        
+        assert total_points == 600  # 100 + 200 + 300
+    
+    def test_get_recent_rewards(self, db: Session, test_user, frozen_now):
+        """Test getting recent rewards for a user"""
+        # Create rewards with different dates
+        rewards = [
+            Reward(
+                user_id=test_user.id,
+                points=100,
+                bill_amount=D100,
+                category="utilities",
+                on_time_payment=True,
+                earned_at=frozen_now - timedelta(days=i)
+            )
+            for i in range(10)
+        ]
+        
+        db.bulk_save_objects(rewards)
+        db.commit()
+        
+        recent_rewards = reward_crud.get_recent_rewards(
+            db=db,
+            user_id=test_user.id,
+            limit=5
+        )
+        
+        assert len(recent_rewards) == 5
+        
+        # Verify they're ordered by most recent first
+        dates = [reward.earned_at for reward in recent_rewards]
+        assert dates == sorted(dates, reverse=True)
+    
+    def test_get_monthly_breakdown(self, db: Session, test_user, frozen_now):
+        """Test getting monthly reward breakdown"""
+        # Create rewards for different months: one executemany INSERT
+        rows = [
+            {
+                "user_id": test_user.id,
+                "points": 100,
+                "bill_amount": D100,
+                "category": f"category_{j}",
+                "on_time_payment": True,
+                "earned_at": frozen_now - timedelta(days=30 * i + j)
+            }
+            for i in range(6)  # Last 6 months
+            for j in range(3)  # 3 rewards per month
+        ]
+        db.execute(insert(Reward), rows)
+        db.commit()
+        
+        with count_queries(db.connection()) as queries:
+            monthly_breakdown = reward_crud.get_monthly_breakdown(
+                db=db,
+                user_id=test_user.id
+            )
+        
+        assert isinstance(monthly_breakdown, list)
+        
+        # One grouped query, however many months are seeded
+        assert len(queries) == 1
+        
+        # Should have data for up to 6 months
+        assert len(monthly_breakdown) <= 6
+        
+        for month_data in monthly_breakdown:
+            assert "month" in month_data
+            assert "total_points" in month_data
+            assert "reward_count" in month_data
+            assert "categories" in month_data
+            assert isinstance(month_data["categories"], dict)
+    
+    @pytest.mark.usefixtures("leaderboard_users")
+    def test_get_leaderboard_crud(self, db: Session):
+        """Test getting leaderboard via CRUD"""
+        leaderboard = reward_crud.get_leaderboard(
+            db=db,
+            period="all",
+            limit=5
+        )
+        
+        assert isinstance(leaderboard, list)
+        assert len(leaderboard) == 5
+        
+        # Verify ranking
+        points = [entry["total_points"] for entry in leaderboard]
+        assert points == sorted(points, reverse=True)
+        
+        # Verify each entry has required fields
+        for entry in leaderboard:
+            assert "user_id" in entry
+            assert "username" in entry
+            assert "total_points" in entry
+            assert "current_tier" in entry
+            assert "rank" in entry
+    
+    def test_get_user_reward_stats(self, db: Session, new_user):
+        """Test getting user reward statistics"""
+        # Create various rewards
+        rewards = [
+            Reward(
+                user_id=new_user.id,
+                points=100,
+                bill_amount=D100,
+                category="utilities",
+                on_time_payment=True
+            ),
+            Reward(
+                user_id=new_user.id,
+                points=150,
+                bill_amount=D150,
+                category="rent",
+                on_time_payment=True
+            ),
+            Reward(
+                user_id=new_user.id,
+                points=200,
+                bill_amount=D200,
+                category="utilities",
+                on_time_payment=False  # Late payment
+            )
+        ]
+        
+        db.bulk_save_objects(rewards)
+        db.commit()
+        
+        stats = reward_crud.get_user_reward_stats(db=db, user_id=new_user.id)
+        
+        assert stats["total_points"] == 450  # 100 + 150 + 200
+        assert stats["total_rewards"] == 3
+        assert stats["avg_points_per_reward"] == 150.0  # 450 / 3
+        assert stats["on_time_payment_rate"] == 66.67  # 2 out of 3 on time
+        assert "category_breakdown" in stats
+        assert "streak_days" in stats
+        assert "last_reward_date" in stats
+        
+        # Verify category breakdown
+        categories = {item["category"] for item in stats["category_breakdown"]}
+        assert "utilities" in categories
+        assert "rent" in categories
+    
+    def test_get_top_categories(self, db: Session, test_user):
+        """Test getting top categories for a user"""
+        # Create rewards in different categories
+        categories = {
+            "utilities": 3,  # 3 rewards
+            "rent": 2,       # 2 rewards
+            "subscription": 1,  # 1 reward
+            "other": 1       # 1 reward
+        }
+        
+        db.bulk_save_objects([
+            Reward(
+                user_id=test_user.id,
+                points=100 * (i + 1),
+                bill_amount=D100,
+                category=category,
+                on_time_payment=True
+            )
+            for category, count in categories.items()
+            for i in range(count)
+        ])
+        db.commit()
+        
+        top_categories = reward_crud.get_top_categories(
+            db=db,
+            user_id=test_user.id,
+            limit=3
+        )
+        
+        assert len(top_categories) == 3
+        
+        # Should be ordered by total points
+        points = [cat["total_points"] for cat in top_categories]
+        assert points == sorted(points, reverse=True)
+        
+        # Verify structure
+        for category in top_categories:
+            assert "category" in category
+            assert "total_points" in category
+            assert "reward_count" in category
+            assert "avg_points" in category
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.reward import Reward, RewardTier
+
+class TestRewardModels:
+    """Test cases for Reward model properties"""
+    
+    def test_reward_tier_property(self, test_reward, monkeypatch):
+        """Test reward tier property"""
+        # Test with different point values
+        test_cases = [
+            (100, RewardTier.BRONZE),
+            (500, RewardTier.SILVER),
+            (2000, RewardTier.GOLD),
+            (5000, RewardTier.PLATINUM),
+            (10000, RewardTier.DIAMOND),
+        ]
+        
+        # monkeypatch restores the shared reward's points afterwards
+        for points, expected_tier in test_cases:
+            monkeypatch.setattr(test_reward, "points", points)
+            assert test_reward.tier == expected_tier
+    
+    def test_reward_to_dict(self, test_reward):
+        """Test reward to_dict method"""
+        reward_dict = test_reward.to_dict()
+        
+        assert isinstance(reward_dict, dict)
+        assert reward_dict["id"] == test_reward.id
+        assert reward_dict["user_id"] == test_reward.user_id
+        assert reward_dict["points"] == test_reward.points
+        assert reward_dict["category"] == test_reward.category
+        assert "tier" in reward_dict
+        assert reward_dict["tier"] == test_reward.tier.value
+    
+    def test_reward_relationships(self, db: Session, test_reward, test_user, test_bill):
+        """Test reward relationships"""
+        # Load the reward with both relationships in one query
+        reward = (
+            db.query(Reward)
+            .options(joinedload(Reward.user), joinedload(Reward.bill))
+            .filter(Reward.id == test_reward.id)
+            .one()
+        )
+        
+        # Test user relationship
+        assert reward.user is not None
+        assert reward.user.id == test_user.id
+        
+        # Test bill relationship
+        assert reward.bill is not None
+        assert reward.bill.id == test_bill.id
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,191 @@
+import pytest
+
+from app.models.reward import RewardTier
+from app.services.reward_service import RewardService
+from app.tests.utils import D100
+
+# Pure calculations: nothing here touches the database
+
+@pytest.fixture(scope="module")
+def service():
+    """RewardService is stateless, so one instance serves the module"""
+    return RewardService()
+
+class TestRewardService:
+    """Test cases for Reward Service"""
+    
+    def test_calculate_points(self, service):
+        """Test points calculation"""
+        # Test basic calculation
+        points = service.calculate_points(
+            bill_amount=D100,
+            on_time_payment=True,
+            category="utilities"
+        )
+        
+        assert points > 0
+        
+        # Test with different categories
+        points_rent = service.calculate_points(
+            bill_amount=D100,
+            on_time_payment=True,
+            category="rent"  # Higher multiplier
+        )
+        
+        points_subscription = service.calculate_points(
+            bill_amount=D100,
+            on_time_payment=True,
+            category="subscription"  # Lower multiplier
+        )
+        
+        # Rent should give more points than subscription
+        assert points_rent > points_subscription
+        
+        # Test late payment
+        points_late = service.calculate_points(
+            bill_amount=D100,
+            on_time_payment=False,
+            category="utilities"
+        )
+        
+        points_on_time = service.calculate_points(
+            bill_amount=D100,
+            on_time_payment=True,
+            category="utilities"
+        )
+        
+        # On-time payment should give more points
+        assert points_on_time > points_late
+    
+    @pytest.mark.parametrize("points,expected_tier", [
+        (0, RewardTier.BRONZE),
+        (250, RewardTier.BRONZE),
+        (500, RewardTier.SILVER),
+        (1500, RewardTier.SILVER),
+        (2000, RewardTier.GOLD),
+        (3500, RewardTier.GOLD),
+        (5000, RewardTier.PLATINUM),
+        (7500, RewardTier.PLATINUM),
+        (10000, RewardTier.DIAMOND),
+        (15000, RewardTier.DIAMOND),
+    ])
+    def test_get_current_tier(self, service, points, expected_tier):
+        """Test determining current tier"""
+        assert service.get_current_tier(points) == expected_tier
+    
+    @pytest.mark.parametrize("points,expected_next", [
+        (0, RewardTier.SILVER),
+        (250, RewardTier.SILVER),
+        (500, RewardTier.GOLD),
+        (1500, RewardTier.GOLD),
+        (2000, RewardTier.PLATINUM),
+        (3500, RewardTier.PLATINUM),
+        (5000, RewardTier.DIAMOND),
+        (7500, RewardTier.DIAMOND),
+        (10000, None),  # No next tier for diamond
+        (15000, None),
+    ])
+    def test_get_next_tier(self, service, points, expected_next):
+        """Test determining next tier"""
+        assert service.get_next_tier(points) == expected_next
+    
+    @pytest.mark.parametrize("points,expected_points", [
+        (0, 500),     # Bronze to Silver: 500 - 0 = 500
+        (250, 250),   # Bronze to Silver: 500 - 250 = 250
+        (500, 1500),  # Silver to Gold: 2000 - 500 = 1500
+        (1000, 1000), # Silver to Gold: 2000 - 1000 = 1000
+        (2000, 3000), # Gold to Platinum: 5000 - 2000 = 3000
+        (5000, 5000), # Platinum to Diamond: 10000 - 5000 = 5000
+        (10000, None), # Diamond has no next tier
+    ])
+    def test_get_points_to_next_tier(self, service, points, expected_points):
+        """Test calculating points to next tier"""
+        assert service.get_points_to_next_tier(points) == expected_points
+    
+    def test_get_tier_progress(self, service):
+        """Test getting tier progress information"""
+        # Test in middle of silver tier
+        progress = service.get_tier_progress(1000)  # Silver: 500-1999
+        
+        assert progress["current_tier"] == RewardTier.SILVER
+        assert progress["points_in_current_tier"] == 500  # 1000 - 500
+        # Should be about 33% through silver tier (500/1500)
+        assert 30 <= progress["progress_percentage"] <= 35
+        assert progress["next_tier"] == RewardTier.GOLD
+        
+        # Test at max tier (diamond)
+        progress = service.get_tier_progress(15000)
+        
+        assert progress["current_tier"] == RewardTier.DIAMOND
+        assert progress["progress_percentage"] == 100
+        assert progress["next_tier"] is None
+    
+    def test_get_all_tiers(self, service):
+        """Test getting all tier information"""
+        tiers = service.get_all_tiers()
+        
+        assert len(tiers) == 5
+        
+        # Verify all tiers are present
+        tier_names = [tier["tier"] for tier in tiers]
+        assert RewardTier.BRONZE in tier_names
+        assert RewardTier.SILVER in tier_names
+        assert RewardTier.GOLD in tier_names
+        assert RewardTier.PLATINUM in tier_names
+        assert RewardTier.DIAMOND in tier_names
+        
+        # Verify each tier has required fields
+        for tier in tiers:
+            assert "min_points" in tier
+            assert "max_points" in tier
+            assert "multiplier" in tier
+            assert "benefits" in tier
+            assert "color" in tier
+    
+    def test_get_reward_breakdown(self, service):
+        """Test getting detailed reward breakdown"""
+        breakdown = service.get_reward_breakdown(
+            bill_amount=D100,
+            on_time_payment=True,
+            category="rent",
+            streak_days=10
+        )
+        
+        assert breakdown["bill_amount"] == 100.0
+        assert breakdown["category"] == "rent"
+        assert breakdown["on_time_payment"] == True
+        assert breakdown["streak_days"] == 10
+        
+        assert "components" in breakdown
+        assert "total_points" in breakdown
+        assert breakdown["total_points"] > 0
+        
+        # Verify calculation steps
+        assert "calculation_steps" in breakdown
+        assert isinstance(breakdown["calculation_steps"], list)
+        assert len(breakdown["calculation_steps"]) > 0
+    
+    def test_predict_future_tier(self, service):
+        """Test predicting future tier progression"""
+        predictions = service.predict_future_tier(
+            current_points=1000,
+            monthly_point_rate=500,
+            months_ahead=12
+        )
+        
+        assert len(predictions) == 12
+        
+        # Verify structure
+        for prediction in predictions:
+            assert "month" in prediction
+            assert "projected_points" in prediction
+            assert "projected_tier" in prediction
+            assert "tier_progress" in prediction
+            assert "multiplier" in prediction
+        
+        # Points should increase each month
+        points = [p["projected_points"] for p in predictions]
+        assert points == sorted(points)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
\ No newline at end of file
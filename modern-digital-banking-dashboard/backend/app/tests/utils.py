@@ -0,0 +1,46 @@
+"""
+Shared constants and helpers for the backend tests
+"""
+import contextlib
+from decimal import Decimal
+
+from sqlalchemy import event
+
+# Decimal amounts reused across the tests, parsed once at import
+D100 = Decimal("100.00")
+D150 = Decimal("150.00")
+D200 = Decimal("200.00")
+D250 = Decimal("250.00")
+D500 = Decimal("500.00")
+D600 = Decimal("600.00")
+D1200 = Decimal("1200.00")
+
+# Reward fields shared by the reward API and CRUD tests
+TEST_REWARD_DATA = {
+    "bill_amount": D150,
+    "category": "utilities",
+    "on_time_payment": True,
+    "description": "Test reward for bill payment"
+}
+
+# Transaction control the sessions emit around every request; not queries
+_TRANSACTION_SQL = ("BEGIN", "SAVEPOINT", "RELEASE", "ROLLBACK", "COMMIT")
+
+@contextlib.contextmanager
+def count_queries(conn):
+    """Collect the SQL statements executed on ``conn`` inside the block.
+
+    Every test session, including the endpoints', runs on the shared
+    connection, so ``count_queries(db.connection())`` sees API queries too.
+    """
+    queries = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_TRANSACTION_SQL):
+            queries.append(statement)
+
+    event.listen(conn, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(conn, "before_cursor_execute", _before_cursor_execute)